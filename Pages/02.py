@@ -2,6 +2,12 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 
+from session_memory import track_session
+from sweep_animation import render_sweep
+
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("02")
+
 # --- 앱 제목 ---
 st.title("📘 유리함수의 그래프 탐구 디지털 교과서")
 st.markdown("### 주제: $y = \\frac{a}{x}$ 의 그래프와 성질을 탐구해봅시다.")
@@ -33,6 +39,7 @@ if menu == "1. y=a/x의 그래프 그리기":
     ax.grid(True)
 
     st.pyplot(fig)
+    plt.close(fig)
     st.markdown("- 분모가 0이 될 수 없기 때문에, x=0에서는 그래프가 존재하지 않습니다.")
     st.markdown("- y = a/x 는 원점을 중심으로 한 쌍곡선 형태입니다.")
 
@@ -60,11 +67,18 @@ elif menu == "2. a값의 변화에 따른 그래프 모양":
     ax.grid(True)
 
     st.pyplot(fig)
+    plt.close(fig)
     st.markdown("""
     - a의 절댓값이 커질수록 그래프는 축에 더 가까워지며, 기울기가 가파릅니다.  
     - a가 양수이면 1,3사분면에 / a가 음수이면 2,4사분면에 그래프가 위치합니다.
     """)
 
+    if st.checkbox("🎞️ a 값이 연속으로 변하는 모습 보기"):
+        start, stop = st.slider("a 값의 변화 범위", -5.0, 5.0, (-5.0, 5.0), 0.5)
+        # 만든 애니메이션은 서버의 디스크 캐시에 두고 모든 사용자가 재사용합니다.
+        with st.spinner("애니메이션을 만드는 중입니다..."):
+            st.image(render_sweep("a", start, stop, 100))
+
 # --- 3단계: 사분면 위치와 대칭성 ---
 elif menu == "3. 사분면 위치와 대칭성":
     st.subheader("3️⃣ 사분면 위치와 대칭성 탐구")
@@ -82,6 +96,7 @@ elif menu == "3. 사분면 위치와 대칭성":
     ax.legend()
 
     st.pyplot(fig)
+    plt.close(fig)
 
     if a > 0:
         st.markdown("✅ **a > 0일 때:** 그래프는 제1사분면과 제3사분면에 위치합니다.")
@@ -2,6 +2,11 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 
+from session_memory import track_session
+
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("03")
+
 # --- 앱 제목 ---
 st.title("📘 유리함수의 그래프 탐구 디지털 교과서")
 st.markdown("### 주제: $y = \\frac{a}{x}$ 의 그래프와 성질을 탐구해봅시다.")
@@ -25,6 +30,7 @@ ax1.set_ylabel("y")
 ax1.legend()
 ax1.grid(True)
 st.pyplot(fig1)
+plt.close(fig1)
 
 st.markdown("""
 - 분모가 0인 x=0에서는 그래프가 존재하지 않습니다.  
@@ -48,6 +54,7 @@ ax2.set_title("a 값의 변화에 따른 그래프 모양 비교")
 ax2.legend()
 ax2.grid(True)
 st.pyplot(fig2)
+plt.close(fig2)
 
 st.markdown("""
 - a의 절댓값이 커질수록 그래프는 축에 가까워집니다.  
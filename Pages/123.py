@@ -2,12 +2,17 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 
+from session_memory import track_session
+
 # 페이지 설정
 st.set_page_config(
     page_title="유리함수 그래프 학습 앱",
     layout="wide"
 )
 
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("123")
+
 # 메인 제목 및 설명
 st.title("📊 유리함수 그래프 학습 앱")
 st.write("계수 $a, b, c, d$를 입력하여 유리함수 $y = \\frac{ax+b}{cx+d}$의 그래프를 그려보세요.")
@@ -92,6 +97,7 @@ else:
         
         # 그래프 출력
         st.pyplot(fig)
+        plt.close(fig)
         
         # --- 추가 정보 표시 ---
         st.markdown("## 📚 유리함수의 특징")
@@ -2,12 +2,37 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 
+from intersections import exact_intersections, from_coefficients, from_line, intersections
+from rational_utils import exact_properties, fraction_latex, sample_curve, to_fraction
+from session_memory import track_session
+
 # 페이지 설정
 st.set_page_config(
     page_title="유리함수 그래프 학습 앱",
     layout="wide"
 )
 
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("Ex")
+
+# 곡선 표본과 교점을 함께 계산해 캐시합니다. 교점은 근의 공식으로 바로 구하므로
+# 표본 배열을 훑지 않습니다.
+# 계수는 자유롭게 입력하는 실수라 조합이 끝없으므로 최근 것만 남깁니다.
+@st.cache_data(max_entries=64)
+def curve_data(a, b, c, d, x_min, x_max, other):
+    pieces = sample_curve(a, b, c, d, x_min, x_max)
+    if other is None:
+        return pieces, [], np.empty(0), np.empty(0)
+    p, q, r, s = other
+    if r == 0:
+        x = np.array([x_min, x_max])
+        other_pieces = [(x, (p * x + q) / s)]
+    else:
+        other_pieces = sample_curve(p, q, r, s, x_min, x_max)
+    xs, ys = intersections(from_coefficients(a, b, c, d), other)
+    found = ~np.isnan(xs)
+    return pieces, other_pieces, xs[found], ys[found]
+
 # 메인 제목 및 설명
 st.title("📊 유리함수 그래프 학습 앱")
 st.write("계수 $a, b, c, d$를 입력하여 유리함수 $y = \\frac{ax+b}{cx+d}$의 그래프를 그려보세요.")
@@ -29,53 +54,74 @@ with st.sidebar:
     y_min = st.number_input("y축 최소:", value=-10.0, step=1.0)
     y_max = st.number_input("y축 최대:", value=10.0, step=1.0)
 
+    # 교점을 구할 그래프 설정
+    st.header("교점 찾기")
+    target = st.radio("함께 그릴 그래프", ("없음", "직선 y = mx + n", "유리함수 y = (px+q)/(rx+s)"))
+    other = None
+    if target == "직선 y = mx + n":
+        m = st.number_input("기울기 m:", value=1.0, step=0.1)
+        n = st.number_input("y절편 n:", value=0.0, step=0.1)
+        other = from_line(m, n)
+    elif target == "유리함수 y = (px+q)/(rx+s)":
+        p = st.number_input("계수 p:", value=-1.0, step=0.1)
+        q = st.number_input("계수 q:", value=2.0, step=0.1)
+        r = st.number_input("계수 r:", value=1.0, step=0.1)
+        s = st.number_input("계수 s:", value=1.0, step=0.1)
+        if r == 0 and s == 0:
+            st.error("오류: $r$와 $s$ 모두 0일 수 없습니다.")
+        else:
+            other = (p, q, r, s)
+
+# 점근선, 대칭의 중심 등 성질은 분수로 정확하게 계산합니다. (같은 계수면 캐시 사용)
+# 그래프를 그리는 배열만 실수(float64)로 계산합니다.
+props = exact_properties(a, b, c, d)
+fa, fb, fc, fd = props["coefficients"]
+
 # 0으로 나누는 경우 방지
-if c == 0 and d == 0:
+if props["kind"] == "invalid":
     st.error("오류: $c$와 $d$ 모두 0일 수 없습니다 (분모가 0이 됩니다).")
-elif c == 0 and a != 0:
+elif fc == 0 and fa != 0:
     st.error("오류: $c=0$이고 $a \\neq 0$이면, 선형 함수가 되거나(a=0인 경우) 상수 함수가 됩니다.")
 else:
     # 수직 점근선 계산
     # 분모 $cx+d = 0$이 되는 $x$ 값
-    if c != 0:
-        vertical_asymptote = -d / c
+    if fc != 0:
+        vertical_asymptote = float(props["vertical"])
         # 수평 점근선 계산
         # $y = a/c$
-        horizontal_asymptote = a / c
+        horizontal_asymptote = float(props["horizontal"])
+        vertical_latex = fraction_latex(props["vertical"])
+        horizontal_latex = fraction_latex(props["horizontal"])
+        center_latex = f"({vertical_latex}, {horizontal_latex})"
         
         # 그래프 생성
         fig, ax = plt.subplots(figsize=(10, 6))
 
-        # 유리함수 정의
-        def rational_function(x):
-            return (a * x + b) / (c * x + d)
+        # x 값 생성. 점근선이 범위 안에 있으면 점근선 주변을 제외한 두 구간으로 나눕니다.
+        pieces, other_pieces, cross_x, cross_y = curve_data(a, b, c, d, x_min, x_max, other)
+
+        # 그래프 그리기
+        for i, (x_vals, y_vals) in enumerate(pieces):
+            ax.plot(x_vals, y_vals, label=f"$y = {props['latex']}$" if i == 0 else None, color='blue')
 
-        # x 값 생성. 점근선 근처에서 불연속성을 처리하기 위해 구간을 나눕니다.
-        # 점근선이 범위 안에 있을 때만 분할
+        # 수직 점근선 표시 (점근선이 범위 안에 있을 때만)
         if x_min < vertical_asymptote < x_max:
-            # 점근선 주변을 제외한 두 개의 x 배열 생성
-            x1 = np.linspace(x_min, vertical_asymptote - 0.01, 500)
-            x2 = np.linspace(vertical_asymptote + 0.01, x_max, 500)
-            
-            # 그래프 그리기
-            ax.plot(x1, rational_function(x1), label="$y = \\frac{%.2fx + %.2f}{%.2fx + %.2f}$" % (a, b, c, d), color='blue')
-            ax.plot(x2, rational_function(x2), color='blue')
-            
-            # 수직 점근선 표시
-            ax.axvline(vertical_asymptote, color='red', linestyle='--', label=f'수직 점근선 $x = {vertical_asymptote:.2f}$')
-        else:
-            # 점근선이 범위 밖에 있다면 하나의 x 배열만 생성
-            x_vals = np.linspace(x_min, x_max, 1000)
-            ax.plot(x_vals, rational_function(x_vals), label="$y = \\frac{%.2fx + %.2f}{%.2fx + %.2f}$" % (a, b, c, d), color='blue')
+            ax.axvline(vertical_asymptote, color='red', linestyle='--', label=f'수직 점근선 $x = {vertical_latex}$')
+
+        # 함께 그릴 그래프와 교점 표시
+        for i, (x_vals, y_vals) in enumerate(other_pieces):
+            ax.plot(x_vals, y_vals, label=target if i == 0 else None, color='orange')
+        if len(cross_x):
+            ax.plot(cross_x, cross_y, 'X', color='black', markersize=9, label='교점')
 
         # 수평 점근선 표시 (c가 0이 아닐 때만)
-        ax.axhline(horizontal_asymptote, color='green', linestyle='--', label=f'수평 점근선 $y = {horizontal_asymptote:.2f}$')
+        ax.axhline(horizontal_asymptote, color='green', linestyle='--', label=f'수평 점근선 $y = {horizontal_latex}$')
         
         # 교점 표시
         center_x = vertical_asymptote
         center_y = horizontal_asymptote
         
-        ax.plot(center_x, center_y, 'o', color='purple', label=f'대칭의 중심 $({center_x:.2f}, {center_y:.2f})$')
+        ax.plot(center_x, center_y, 'o', color='purple', label=f'대칭의 중심 ${center_latex}$')
 
         # 그래프 제목 및 레이블 설정
         ax.set_title("유리함수 그래프", fontsize=16)
@@ -92,16 +138,30 @@ else:
         
         # 그래프 출력
         st.pyplot(fig)
+        plt.close(fig)
         
         # --- 추가 정보 표시 ---
         st.markdown("## 📚 유리함수의 특징")
-        st.write(f"**함수의 식:** $y = \\frac{%.2fx + %.2f}{%.2fx + %.2f}$" % (a, b, c, d))
-        st.write(f"**수직 점근선:** 분모가 0이 되는 $x$ 값, $cx+d=0 \\implies x = {vertical_asymptote:.2f}$")
-        st.write(f"**수평 점근선:** 계수 $x$의 비, $y = \\frac{a}{c} \\implies y = {horizontal_asymptote:.2f}$")
-        st.write(f"**대칭의 중심:** 두 점근선의 교점 $({center_x:.2f}, {center_y:.2f})$")
+        st.write(f"**함수의 식:** $y = {props['latex']}$")
+        st.write(f"**수직 점근선:** 분모가 0이 되는 $x$ 값, $cx+d=0 \\implies x = {vertical_latex}$")
+        st.write(f"**수평 점근선:** 계수 $x$의 비, $y = \\frac{{a}}{{c}} \\implies y = {horizontal_latex}$")
+        st.write(f"**대칭의 중심:** 두 점근선의 교점 ${center_latex}$")
+        st.write(f"**정의역:** ${props['domain_latex']}$, **치역:** ${props['range_latex']}$")
+        if other is not None:
+            points = exact_intersections(
+                props["coefficients"], tuple(to_fraction(v) for v in other)
+            )
+            if points is None:
+                st.write("**교점:** 두 그래프가 일치합니다.")
+            elif points:
+                st.write("**교점:** " + ", ".join(f"${point}$" for point in points))
+            else:
+                st.write("**교점:** 없음")
+        if props["kind"] == "constant":
+            st.warning("참고: $ad-bc=0$이므로 약분하면 $x \\neq " + vertical_latex + "$인 **상수 함수** $y = " + horizontal_latex + "$가 됩니다.")
 
     else: # c=0이고 d!=0인 경우 (상수 함수 또는 선형 함수)
-        if a / d == 0:
+        if fa == 0:
             st.warning("경고: 이 함수는 $y = \\frac{b}{d}$인 **상수 함수**입니다 (분자가 $ax+b$에서 $a=0$일 때).")
         else:
             st.warning("경고: 이 함수는 $y = \\frac{a}{d}x + \\frac{b}{d}$인 **선형 함수**입니다 ($c=0$일 때).")
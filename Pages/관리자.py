@@ -0,0 +1,77 @@
+import hmac
+import os
+
+import streamlit as st
+
+from session_memory import get_registry, track_session
+from shared_cache import get_array_cache, get_disk_cache
+
+st.set_page_config(page_title="관리자", layout="wide")
+
+track_session("관리자")
+
+st.title("🛠️ 서버 메모리 관리")
+
+# ADMIN_PASSWORD 환경 변수가 없으면 페이지를 열지 않습니다. (학생도 접속하는 서버이므로)
+password = os.environ.get("ADMIN_PASSWORD")
+if not password:
+    st.info("관리자 비밀번호(ADMIN_PASSWORD 환경 변수)가 설정되어 있지 않아 이 페이지를 사용할 수 없습니다.")
+    st.stop()
+entered = st.text_input("관리자 비밀번호:", type="password")
+# compare_digest 는 ASCII 가 아닌 문자열을 받지 않으므로 바이트로 비교합니다.
+if not hmac.compare_digest(entered.encode("utf-8"), password.encode("utf-8")):
+    st.stop()
+
+registry = get_registry()
+
+def current_rss_mb():
+    """이 서버 프로세스의 현재 메모리(RSS)를 MB 단위로 돌려줍니다 (리눅스)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+col1, col2, col3 = st.columns(3)
+sessions, pages = registry.report()
+with col1:
+    rss = current_rss_mb()
+    st.metric("서버 메모리(RSS)", f"{rss:.0f} MB" if rss is not None else "알 수 없음")
+with col2:
+    st.metric("추적 중인 세션", len(sessions))
+with col3:
+    st.metric("세션 상태 합계", f"{sum(pages.values()) / 1024:.1f} KB")
+
+st.caption(
+    f"정리 정책: {registry.compact_after / 60:.0f}분 동안 쉰 세션은 큰 값을 디스크로 옮기고, "
+    f"{registry.evict_after / 3600:.1f}시간 동안 쉰 세션은 지웁니다."
+)
+if st.button("🧹 지금 정리하기"):
+    registry.sweep()
+    st.rerun()
+
+st.markdown("---")
+
+st.subheader("📄 페이지별 세션 상태 사용량")
+if pages:
+    st.bar_chart({page: round(size / 1024, 1) for page, size in pages.items()})
+else:
+    st.write("아직 기록된 세션이 없습니다.")
+
+st.subheader("👥 세션 목록")
+if sessions:
+    st.dataframe(sessions, use_container_width=True)
+else:
+    st.write("아직 기록된 세션이 없습니다.")
+
+st.markdown("---")
+
+st.subheader("🗄️ 공유 캐시")
+for label, cache in (("바이트 캐시(디스크)", get_disk_cache()), ("배열 캐시(공유 메모리)", get_array_cache())):
+    stats = cache.stats()
+    st.write(
+        f"**{label}:** 항목 {stats['entries']}개, "
+        f"{stats['bytes'] / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB, "
+        f"이 프로세스 적중 {stats['hits']}회 / 실패 {stats['misses']}회"
+    )
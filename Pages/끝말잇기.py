@@ -1,17 +1,58 @@
+import datetime
+
 import streamlit as st
 
+from result_store import get_store
+from session_memory import restore_session, track_session
+from word_index import get_word_index
+
+# 오래 쉬는 세션에서 디스크로 옮겨 둘 수 있는 큰 값
+SPILLABLE_KEYS = ("game_words", "used_words")
+
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session(
+    "끝말잇기",
+    keys=("game_words", "used_words", "last_char", "message", "game_over"),
+    spillable=SPILLABLE_KEYS
+)
+
+store = get_store()
+word_index = get_word_index()  # 단어 목록 파일이 없으면 None (힌트 기능 꺼짐)
+
 # --- 초기 설정 및 세션 상태 관리 ---
 # st.session_state를 사용하여 게임 상태 저장
 
-if 'game_words' not in st.session_state:
-    st.session_state.game_words = [] # 사용된 단어 목록
-    st.session_state.last_char = None  # 마지막 글자
-    st.session_state.message = "게임을 시작합니다! 아무 단어나 입력하세요."
-    st.session_state.game_over = False
+def ensure_game_state():
+    """게임 상태를 준비합니다.
+
+    위젯 콜백은 페이지 본문보다 먼저 실행되므로, 콜백에서도 이 함수를 먼저 불러
+    디스크로 옮겨 둔 값은 되살리고 정리되어 없어진 값은 새로 만듭니다.
+    """
+    restore_session(SPILLABLE_KEYS)
+    if 'game_words' not in st.session_state:
+        st.session_state.game_words = [] # 사용된 단어 목록
+        st.session_state.last_char = None  # 마지막 글자
+        st.session_state.message = "게임을 시작합니다! 아무 단어나 입력하세요."
+        st.session_state.game_over = False
+
+    # 중복 검사와 힌트용 사용 단어 집합 (목록을 훑지 않도록 집합으로 보관)
+    if 'used_words' not in st.session_state:
+        st.session_state.used_words = set(st.session_state.game_words)
+
+ensure_game_state()
+
+def player_name():
+    """기록에 남길 이름을 돌려줍니다."""
+    return st.session_state.get("player_name", "").strip() or "익명"
 
 def initialize_game():
     """게임 상태를 초기화합니다."""
+    ensure_game_state()
+    # 끝나지 않은 채 새로 시작하는 게임도 기록에 남깁니다. (게임 오버는 이미 저장됨)
+    if st.session_state.game_words and not st.session_state.game_over:
+        store.log_game(player_name(), st.session_state.game_words)
     st.session_state.game_words = []
+    st.session_state.used_words = set()
     st.session_state.last_char = None
     st.session_state.message = "게임을 시작합니다! 아무 단어나 입력하세요."
     st.session_state.game_over = False
@@ -30,7 +71,7 @@ def check_word(new_word):
         return False
 
     # 3. 중복 단어 검사
-    if new_word in st.session_state.game_words:
+    if new_word in st.session_state.used_words:
         st.session_state.message = f"❌ '{new_word}'은(는) 이미 사용된 단어입니다. 게임 오버!"
         st.session_state.game_over = True
         return False
@@ -47,7 +88,7 @@ def check_word(new_word):
 
 def process_word():
     """입력된 단어를 처리하고 게임 상태를 업데이트합니다."""
-    
+    ensure_game_state()
     new_word = st.session_state.input_word.strip()
 
     if st.session_state.game_over:
@@ -58,10 +99,14 @@ def process_word():
     if check_word(new_word):
         # 단어 추가 및 상태 업데이트
         st.session_state.game_words.append(new_word)
+        st.session_state.used_words.add(new_word)
         st.session_state.last_char = new_word[-1]
         st.session_state.message = f"✅ 성공! 다음은 '{st.session_state.last_char}'로 시작하는 단어를 입력하세요."
         st.session_state.input_word = "" # 입력창 비우기
     else:
+        # 게임이 끝났다면 기록을 저장합니다. (저장은 백그라운드에서 처리됩니다)
+        if st.session_state.game_over and st.session_state.game_words:
+            store.log_game(player_name(), st.session_state.game_words)
         # 단어가 유효하지 않은 경우, 입력창은 비우지 않아 사용자가 다시 시도 가능하도록 할 수도 있습니다.
         # 여기서는 비워서 다음 입력을 유도합니다.
         st.session_state.input_word = ""
@@ -70,6 +115,7 @@ def process_word():
 # --- Streamlit UI 구성 ---
 
 st.title("🔗 끝말잇기 게임")
+st.text_input("이름 (기록에 표시됩니다):", key="player_name", placeholder="익명")
 st.markdown("---")
 
 # 현재 게임 상태 표시
@@ -102,6 +148,20 @@ st.text_input(
     placeholder=f"'{st.session_state.last_char}'로 시작하는 단어" if st.session_state.last_char else "아무 단어나 입력"
 )
 
+# 힌트 (앞부분을 입력하면 사용하지 않은 단어를 자주 쓰이는 순서로 보여 줍니다)
+if word_index is not None and not st.session_state.game_over:
+    with st.expander("💡 힌트 보기"):
+        hint_prefix = st.text_input(
+            "단어의 앞부분:",
+            value=st.session_state.last_char or "",
+            key=f"hint_prefix_{len(st.session_state.game_words)}"
+        ).strip()
+        if st.session_state.last_char and not hint_prefix.startswith(st.session_state.last_char):
+            st.write(f"'{st.session_state.last_char}'로 시작하는 앞부분을 입력하세요.")
+        else:
+            hints = word_index.suggest(hint_prefix, st.session_state.used_words, k=5)
+            st.write(", ".join(hints) if hints else "추천할 단어가 없습니다.")
+
 # 게임 재시작 버튼
 st.button("🔄 새 게임 시작", on_click=initialize_game)
 
@@ -119,3 +179,22 @@ if st.session_state.game_words:
     )
 else:
     st.write("아직 사용된 단어가 없습니다.")
+
+st.markdown("---")
+
+# 기록 (저장소의 메모리 캐시에서 바로 읽어 옵니다)
+st.subheader("🏆 최고 기록")
+leaderboard = store.word_game_leaderboard()
+if leaderboard:
+    for rank, (name, count, ended_at) in enumerate(leaderboard, start=1):
+        st.write(f"{rank}. **{name}** - {count}개 ({datetime.datetime.fromtimestamp(ended_at):%m/%d %H:%M})")
+else:
+    st.write("아직 기록이 없습니다.")
+
+with st.expander(f"📜 {player_name()}님의 최근 게임"):
+    history = store.word_game_history(player_name())
+    if history:
+        for words, count, ended_at in history:
+            st.write(f"{datetime.datetime.fromtimestamp(ended_at):%m/%d %H:%M} - {count}개: {' → '.join(words)}")
+    else:
+        st.write("아직 기록이 없습니다.")
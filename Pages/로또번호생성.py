@@ -1,13 +1,20 @@
 import streamlit as st
 import random
+import datetime
 import pandas as pd
 
+from result_store import get_store
+from session_memory import track_session
+
 # 페이지 설정
 st.set_page_config(
     page_title="로또 번호 생성기",
     layout="centered"
 )
 
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("로또번호생성")
+
 # 로또 번호 생성 함수
 def generate_lotto_numbers():
     """1부터 45 사이의 중복 없는 6개 숫자를 오름차순으로 생성"""
@@ -20,7 +27,7 @@ def generate_lotto_numbers():
 st.title("🍀 대한민국 로또 번호 생성기")
 st.markdown("1부터 45 사이의 숫자 중 **중복 없는 6개**의 숫자를 무작위로 생성합니다.")
 
----
+st.markdown("---")
 
 # 1. 게임 수 입력 (슬라이더)
 # st.slider를 사용하여 1부터 10까지의 정수를 입력받습니다.
@@ -55,6 +62,11 @@ if st.button('🎲 번호 생성'):
             "숫자6": lotto_numbers[5]
         })
     
+    # 생성한 번호 묶음을 압축해서 저장 (백그라운드에서 기록됩니다)
+    get_store().save_tickets("익명", [
+        [row[f"숫자{n}"] for n in range(1, 7)] for row in results
+    ])
+
     # 결과를 DataFrame으로 변환
     df = pd.DataFrame(results)
     
@@ -62,3 +74,15 @@ if st.button('🎲 번호 생성'):
     st.table(df[['게임', '번호']].style.set_properties(**{'font-size': '18px'}))
     
     st.balloons() # 번호 생성 후 풍선 효과!
+
+st.markdown("---")
+
+# 최근 생성 기록
+st.subheader("📜 최근 생성 기록")
+recent = get_store().recent_tickets()
+if recent:
+    for _, created_at, tickets in recent:
+        st.write(f"**{datetime.datetime.fromtimestamp(created_at):%m/%d %H:%M}**")
+        st.text("\n".join(" | ".join(f"{num:02d}" for num in numbers) for numbers in tickets))
+else:
+    st.write("아직 생성 기록이 없습니다.")
@@ -1,9 +1,31 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from fractions import Fraction
+
+from intersections import exact_intersections, from_line, from_shifted, intersections
+from session_memory import track_session
+from sweep_animation import ffmpeg_available, render_sweep
 
 st.set_page_config(page_title="유리함수 학습 앱", layout="centered")
 
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("유리함수교과서")
+
+# 곡선 표본과 직선과의 교점을 함께 계산해 캐시합니다. (교점은 근의 공식으로 바로 구함)
+# 계수는 자유롭게 입력하는 실수라 조합이 끝없으므로 최근 것만 남깁니다.
+@st.cache_data(max_entries=64)
+def curve_data(a, h, k, line):
+    x1 = np.linspace(-10, h - 0.1, 400)
+    x2 = np.linspace(h + 0.1, 10, 400)
+    y1 = a / (x1 - h) + k
+    y2 = a / (x2 - h) + k
+    if line is None:
+        return x1, y1, x2, y2, np.empty(0), np.empty(0)
+    xs, ys = intersections(from_shifted(a, h, k), from_line(*line))
+    found = ~np.isnan(xs)
+    return x1, y1, x2, y2, xs[found], ys[found]
+
 st.title("📘 유리함수 학습하기")
 st.write("유리함수의 성질을 그래프와 함께 정리해 봅시다.")
 
@@ -38,21 +60,28 @@ k = st.slider("k 값 (y 이동)", -5, 5, 0)
 
 st.latex(rf"f(x)=\frac{{{a}}}{{x-{h}}}+{k}")
 
+line = None
+if st.checkbox("직선 y = mx + n 과의 교점 찾기"):
+    m = st.slider("m 값 (기울기)", -5, 5, 1)
+    n = st.slider("n 값 (y절편)", -5, 5, 0)
+    line = (m, n)
+
 # -------------------------------------------------
 # 3. 그래프 그리기
 # -------------------------------------------------
 st.header("3. 그래프")
 
-x1 = np.linspace(-10, h - 0.1, 400)
-x2 = np.linspace(h + 0.1, 10, 400)
-
-y1 = a / (x1 - h) + k
-y2 = a / (x2 - h) + k
+x1, y1, x2, y2, cross_x, cross_y = curve_data(a, h, k, line)
 
 fig, ax = plt.subplots()
 ax.plot(x1, y1)
 ax.plot(x2, y2)
 
+# 직선과 교점
+if line is not None:
+    ax.plot([-10, 10], [-10 * m + n, 10 * m + n], color="orange")
+    ax.plot(cross_x, cross_y, "X", color="black", markersize=9)
+
 # 점근선
 ax.axvline(x=h, linestyle="--")
 ax.axhline(y=k, linestyle="--")
@@ -65,6 +94,36 @@ ax.set_ylim(-10, 10)
 ax.set_title("유리함수의 그래프")
 
 st.pyplot(fig)
+plt.close(fig)
+
+if line is not None:
+    points = exact_intersections(
+        from_shifted(Fraction(a), Fraction(h), Fraction(k)), from_line(Fraction(m), Fraction(n))
+    )
+    if points is None:
+        st.write("교점: 두 그래프가 일치합니다.")
+    elif points:
+        st.latex(r"\text{교점: } " + r",\ ".join(points))
+    else:
+        st.write("교점: 없음")
+
+st.subheader("🎞️ 매개변수에 따른 그래프 변화")
+if st.checkbox("애니메이션으로 보기"):
+    param = st.radio("변화시킬 값", ("a", "h", "k"), horizontal=True)
+    start, stop = st.slider("변화 범위", -5.0, 5.0, (-5.0, 5.0), 0.5)
+    fmt = "mp4" if ffmpeg_available() and st.checkbox("MP4로 만들기") else "gif"
+
+    # 같은 설정의 애니메이션은 디스크 캐시에서 모든 사용자가 함께 재사용합니다.
+    with st.spinner("애니메이션을 만드는 중입니다..."):
+        movie = render_sweep(param, start, stop, 100, a, h, k, fmt)
+    if fmt == "mp4":
+        st.video(movie)
+    else:
+        st.image(movie)
+    st.download_button(
+        f"⬇️ {fmt.upper()} 내려받기", movie,
+        file_name=f"sweep_{param}.{fmt}", mime="video/mp4" if fmt == "mp4" else "image/gif"
+    )
 
 st.divider()
 
@@ -0,0 +1,126 @@
+import random
+
+import streamlit as st
+
+from quiz_bank import QUESTION_TYPES, build_bank, check_answer, format_answer
+from result_store import get_store
+from session_memory import restore_session, track_session
+
+st.set_page_config(page_title="유리함수 퀴즈", layout="centered")
+
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("퀴즈", keys=("quiz_question", "quiz_score", "quiz_total", "quiz_feedback"))
+
+# 문제은행은 서버에서 한 번만 만들어 모든 학생이 함께 사용합니다.
+@st.cache_resource
+def get_bank():
+    return build_bank()
+
+bank = get_bank()
+store = get_store()
+
+# --- 세션 상태 초기화 ---
+def ensure_quiz_state():
+    """퀴즈 상태를 준비합니다. 콜백은 페이지 본문보다 먼저 실행되므로 콜백에서도 부릅니다.
+
+    오래 쉰 세션은 정리되면서 상태가 지워질 수 있으므로, 정리를 먼저 마친 뒤
+    없는 값만 새로 만듭니다.
+    """
+    restore_session()
+    defaults = {
+        "quiz_question": None,  # (유형, 문제 번호)
+        "quiz_score": 0,
+        "quiz_total": 0,
+        "quiz_feedback": None,
+    }
+    for key, value in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+
+ensure_quiz_state()
+
+def new_question(question_type):
+    """선택한 유형(또는 무작위 유형)의 문제를 하나 뽑습니다."""
+    ensure_quiz_state()
+    if question_type is None:
+        question_type = random.choice(list(QUESTION_TYPES))
+    st.session_state.quiz_question = (question_type, random.randrange(len(bank[question_type])))
+    st.session_state.quiz_feedback = None
+
+def reset_score():
+    """점수를 초기화합니다."""
+    ensure_quiz_state()
+    st.session_state.quiz_score = 0
+    st.session_state.quiz_total = 0
+    st.session_state.quiz_feedback = None
+
+# --- 화면 구성 ---
+st.title("📝 유리함수 퀴즈")
+st.write("문제를 풀고 답을 입력하세요. 분수는 `1/3` 처럼 입력합니다.")
+player = st.text_input("이름 (입력하면 진행 상황이 저장됩니다):", key="player_name").strip()
+st.markdown("---")
+
+labels = {"무작위": None}
+labels.update({label: key for key, label in QUESTION_TYPES.items()})
+selected = labels[st.selectbox("문제 유형", list(labels))]
+
+col1, col2 = st.columns(2)
+with col1:
+    st.metric("맞힌 문제", f"{st.session_state.quiz_score} / {st.session_state.quiz_total}")
+with col2:
+    st.button("🎲 새 문제", on_click=new_question, args=(selected,))
+    st.button("🔄 점수 초기화", on_click=reset_score)
+
+if st.session_state.quiz_question is None:
+    new_question(selected)
+
+question_type, index = st.session_state.quiz_question
+question = bank[question_type][index]
+
+st.subheader(f"문제 ({QUESTION_TYPES[question_type]})")
+st.latex(question["latex"])
+st.write(question["prompt"])
+
+with st.form(key=f"quiz_{question_type}_{index}"):
+    if "choices" in question:
+        responses = st.radio("답", question["choices"])
+    else:
+        responses = [st.text_input(field) for field in question["fields"]]
+    submitted = st.form_submit_button("채점하기")
+
+if submitted:
+    correct = check_answer(question, responses)
+    if player:
+        store.record_answer(player, question_type, correct)
+    new_question(selected)
+    st.session_state.quiz_total += 1
+    if correct:
+        st.session_state.quiz_score += 1
+        st.session_state.quiz_feedback = "✅ 정답입니다!"
+    else:
+        st.session_state.quiz_feedback = f"❌ 틀렸습니다. 정답: {format_answer(question)}"
+    st.rerun()
+
+if st.session_state.quiz_feedback:
+    if st.session_state.quiz_feedback.startswith("✅"):
+        st.success(st.session_state.quiz_feedback)
+    else:
+        st.error(st.session_state.quiz_feedback)
+
+st.markdown("---")
+
+# 진행 상황과 순위 (저장소의 메모리 캐시에서 바로 읽어 옵니다)
+if player:
+    st.subheader(f"📈 {player}님의 유형별 진행 상황")
+    progress = store.quiz_progress(player)
+    for key, label in QUESTION_TYPES.items():
+        correct, total = progress.get(key, (0, 0))
+        st.write(f"- {label}: {correct} / {total}")
+
+st.subheader("🏆 순위")
+leaderboard = store.quiz_leaderboard()
+if leaderboard:
+    for rank, (name, correct, total) in enumerate(leaderboard, start=1):
+        st.write(f"{rank}. **{name}** - {correct}문제 정답 (총 {total}문제)")
+else:
+    st.write("아직 기록이 없습니다.")
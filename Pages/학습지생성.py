@@ -0,0 +1,54 @@
+import io
+import time
+
+import streamlit as st
+
+from session_memory import track_session
+from shared_cache import get_disk_cache
+from worksheet import LAYOUT_VERSION, build_worksheet_pdf
+
+# 페이지 설정
+st.set_page_config(
+    page_title="유리함수 학습지 생성기",
+    layout="centered"
+)
+
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("학습지생성")
+
+st.title("🖨️ 유리함수 학습지 생성기")
+st.write("시드를 입력하면 학생마다 서로 다른 $y = \\frac{ax+b}{cx+d}$ 문제와 정답지를 PDF로 만들어 줍니다.")
+st.markdown("---")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    seed = st.number_input("시드:", value=2025, step=1)
+with col2:
+    students = st.number_input("학생 수:", min_value=1, max_value=200, value=40, step=1)
+with col3:
+    per_student = st.number_input("학생당 문제 수:", min_value=1, max_value=8, value=4, step=1)
+
+st.caption("같은 시드로 만들면 언제나 같은 학습지가 만들어집니다.")
+
+if st.button('📄 학습지 만들기'):
+    start = time.perf_counter()
+    # 같은 조건으로 만든 학습지는 공유 캐시에서 바로 꺼내 씁니다. (다른 서버 프로세스 포함)
+    cache = get_disk_cache()
+    key = ("worksheet_pdf", LAYOUT_VERSION, int(seed), int(students), int(per_student))
+    pdf_bytes = cache.get(key)
+    if pdf_bytes is None:
+        buffer = io.BytesIO()
+        with st.spinner("학습지를 만드는 중입니다..."):
+            build_worksheet_pdf(buffer, int(seed), int(students), int(per_student))
+        pdf_bytes = buffer.getvalue()
+        cache.set(key, pdf_bytes)
+
+    elapsed = time.perf_counter() - start
+    total = int(students) * int(per_student)
+    st.success(f"✅ 문제 {total}개를 {elapsed:.1f}초 만에 만들었습니다.")
+    st.download_button(
+        label="⬇️ PDF 내려받기",
+        data=pdf_bytes,
+        file_name=f"worksheet_seed{int(seed)}.pdf",
+        mime="application/pdf"
+    )
@@ -0,0 +1,59 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+
+from function_parser import ALLOWED_NAMES, compile_function, sample_function
+from session_memory import track_session
+
+# 페이지 설정
+st.set_page_config(
+    page_title="함수 그래프 그리기",
+    layout="wide"
+)
+
+# 세션 메모리 사용량 기록 (관리자 페이지에서 확인)
+track_session("함수그래프")
+
+st.title("✏️ 함수식을 입력해 그래프 그리기")
+st.write("원하는 함수식을 직접 입력해 보세요. 예: `(2x^2+1)/(x-3)`, `1/x + 2`, `sin(x)/x`")
+st.markdown("---")
+
+# 사이드바에 사용자 입력 받기
+with st.sidebar:
+    st.header("함수식 입력")
+    text = st.text_input("y =", value="(2x^2+1)/(x-3)")
+    st.caption("사용할 수 있는 이름: " + ", ".join(ALLOWED_NAMES))
+
+    # 그래프 범위 설정
+    st.header("그래프 표시 범위")
+    x_min, x_max = st.slider("x 범위", -20.0, 20.0, (-10.0, 10.0), 0.5)
+    y_min, y_max = st.slider("y 범위", -50.0, 50.0, (-20.0, 20.0), 1.0)
+
+# 해석과 컴파일은 처음 한 번만 하고, 이후에는 캐시된 함수로 배열 계산만 합니다.
+# 복소수가 되는 식(예: sqrt(-1))도 여기서 ValueError 로 걸러집니다.
+try:
+    compiled = compile_function(text)
+    x, y = sample_function(compiled, x_min, x_max)
+except ValueError as error:
+    st.error(f"오류: {error}")
+    st.stop()
+
+st.latex(f"y = {compiled.latex}")
+
+fig, ax = plt.subplots(figsize=(10, 6))
+ax.plot(x, y, color='blue')
+
+# 수직 점근선 표시
+for pole in compiled.poles:
+    if x_min < pole < x_max:
+        ax.axvline(pole, color='red', linestyle='--', label=f'수직 점근선 $x = {pole:.3g}$')
+
+ax.axhline(0, color='black', linewidth=1)
+ax.axvline(0, color='black', linewidth=1)
+ax.set_xlim(x_min, x_max)
+ax.set_ylim(y_min, y_max)
+ax.grid(True, linestyle=':', alpha=0.6)
+if compiled.poles:
+    ax.legend()
+
+st.pyplot(fig)
+plt.close(fig)
@@ -0,0 +1 @@
+"""테스트가 저장소 최상위의 모듈(intersections 등)을 가져올 수 있도록 pytest 가 이 디렉터리를 경로에 넣게 합니다."""
@@ -0,0 +1,210 @@
+"""사용자가 입력한 함수식을 안전하게 해석해 NumPy 함수로 바꿉니다.
+
+식 해석(parse_expr)과 컴파일(lambdify)은 수십~수백 ms 가 걸리므로 한 번만 하고,
+결과는 정규화한 식을 키로 하는 LRU 캐시에 보관합니다. 슬라이더를 움직여 화면을
+다시 그릴 때는 캐시된 함수로 배열 계산만 합니다.
+"""
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import sympy
+from mpmath.libmp.libhyper import NoConvergence
+from sympy.parsing.sympy_parser import (
+    convert_xor,
+    implicit_multiplication_application,
+    parse_expr,
+    standard_transformations,
+)
+from sympy.polys.polyerrors import DomainError, PolynomialError
+
+X = sympy.Symbol("x", real=True)
+
+# 식에 쓸 수 있는 이름만 허용합니다. 그 밖의 이름은 모두 거부합니다.
+ALLOWED_NAMES = {
+    "x": X,
+    "pi": sympy.pi,
+    "e": sympy.E,
+    "sqrt": sympy.sqrt,
+    "abs": sympy.Abs,
+    "exp": sympy.exp,
+    "log": sympy.log,
+    "ln": sympy.log,
+    "sin": sympy.sin,
+    "cos": sympy.cos,
+    "tan": sympy.tan,
+}
+
+TOKEN_PATTERN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|([A-Za-z]+)|(\*\*|[-+*/^()]))")
+MAX_LENGTH = 200
+MAX_COMPILED = 128
+# 9^9^9 처럼 계산에 몇 분이 걸리는 거듭제곱을 막기 위한 상한
+MAX_EXPONENT = 100
+MAX_CONSTANT = sympy.Float("1e300")
+
+TRANSFORMATIONS = standard_transformations + (implicit_multiplication_application, convert_xor)
+
+
+def normalize(text):
+    """입력 문자열을 검사하고 공백을 없앤 형태로 돌려줍니다.
+
+    숫자, 허용된 이름, 사칙연산 기호, 거듭제곱(^, **), 괄호 외의 문자가 있으면
+    ValueError 를 냅니다.
+    """
+    text = text.strip()
+    if not text:
+        raise ValueError("함수식을 입력해 주세요.")
+    if len(text) > MAX_LENGTH:
+        raise ValueError(f"함수식은 {MAX_LENGTH}자 이내로 입력해 주세요.")
+
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise ValueError(f"사용할 수 없는 문자가 있습니다: '{text[position:].strip()[0]}'")
+        number, name, operator = match.groups()
+        if name is not None and name not in ALLOWED_NAMES:
+            raise ValueError(f"알 수 없는 이름입니다: '{name}'")
+        tokens.append(number or name or operator)
+        position = match.end()
+    # 이름끼리 붙지 않도록 이름 사이에만 공백을 남깁니다. (예: 'sin x')
+    normalized = ""
+    for token in tokens:
+        if normalized and normalized[-1].isalnum() and token[0].isalnum():
+            normalized += " "
+        normalized += token
+    return normalized
+
+
+def _exceeds(value, limit):
+    """value 의 절댓값이 limit 보다 큰지 부동소수점으로 어림합니다 (정확한 계산 없이)."""
+    try:
+        return bool(sympy.Abs(value).evalf(15) > limit)
+    except TypeError:  # zoo, nan 처럼 크기를 비교할 수 없는 값은 뒤에서 따로 거릅니다.
+        return False
+
+
+def _check_powers(expr):
+    """계산하지 않은 식에서 지수나 상수 거듭제곱이 지나치게 큰지 검사합니다.
+
+    안쪽 거듭제곱부터 검사하므로 바깥쪽을 어림할 때는 이미 크기가 제한된
+    값만 다룹니다.
+    """
+    for node in sympy.postorder_traversal(expr):
+        if not isinstance(node, sympy.Pow) or not node.exp.is_number:
+            continue
+        if _exceeds(node.exp, MAX_EXPONENT):
+            raise ValueError(f"거듭제곱의 지수는 {MAX_EXPONENT} 이하로 입력해 주세요.")
+        if node.base.is_number and _exceeds(node, MAX_CONSTANT):
+            raise ValueError("계산할 수 없을 만큼 큰 수가 있습니다.")
+
+
+@lru_cache(maxsize=512)
+def parse_function(text):
+    """정규화한 식을 SymPy 식으로 해석하고 (식, 정규 키)를 돌려줍니다.
+
+    먼저 계산하지 않은 채로 해석해 거듭제곱의 크기를 검사한 뒤에 계산합니다.
+    """
+    try:
+        expr = parse_expr(
+            text, local_dict=dict(ALLOWED_NAMES), transformations=TRANSFORMATIONS, evaluate=False
+        )
+    except (SyntaxError, TypeError, ValueError, sympy.SympifyError):
+        raise ValueError("함수식을 해석할 수 없습니다. 괄호와 연산 기호를 확인해 주세요.") from None
+    if not isinstance(expr, sympy.Expr) or expr.free_symbols - {X}:
+        raise ValueError("x 에 대한 함수식을 입력해 주세요.")
+    _check_powers(expr)
+
+    expr = expr.doit()
+    if expr.has(sympy.zoo, sympy.nan, sympy.oo, -sympy.oo):
+        raise ValueError("정의되지 않는 값(예: 1/0)이 있습니다.")
+    # 허수 상수가 있거나 어디서도 실수가 아닌 식은 그래프로 그릴 수 없습니다.
+    if expr.is_extended_real is False or any(
+        node.is_number and node.is_extended_real is False for node in sympy.preorder_traversal(expr)
+    ):
+        raise ValueError("실수가 아닌 값(예: sqrt(-1), log(-1))이 있습니다.")
+    return expr, sympy.srepr(expr)
+
+
+def _real_poles(expr):
+    """분모가 0 이 되는 실수 x 값(수직 점근선 후보)을 구합니다."""
+    denominator = sympy.denom(sympy.together(expr))
+    if denominator.is_number:
+        return ()
+    try:
+        poly = sympy.Poly(denominator, X)
+    except PolynomialError:  # sin(x) 처럼 다항식이 아닌 분모
+        return ()
+    try:
+        # real_roots 는 중근을 겹친 횟수만큼 돌려주므로 한 번씩만 남깁니다.
+        return tuple(sorted(set(float(root) for root in poly.real_roots())))
+    except (NotImplementedError, DomainError):
+        # 계수에 e, pi 가 있으면 정확한 근을 구할 수 없으므로 수치로 구합니다.
+        pass
+    try:
+        roots = poly.nroots()
+    except (NotImplementedError, DomainError, NoConvergence):
+        return ()
+    return tuple(sorted(set(float(sympy.re(root)) for root in roots if abs(sympy.im(root)) < 1e-12)))
+
+
+class CompiledFunction:
+    """lambdify 로 만든 NumPy 함수와 그래프에 필요한 부가 정보를 담습니다."""
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.latex = sympy.latex(expr)
+        self.poles = _real_poles(expr)
+        self._func = sympy.lambdify(X, expr, modules="numpy")
+
+    def __call__(self, x):
+        """x 배열에서 함숫값을 계산합니다. 정의되지 않거나 실수가 아닌 점은 NaN 입니다.
+
+        sqrt(x), log(x) 처럼 음수에서 복소수가 되는 식도 허수부를 버리지 않도록
+        복소수로 계산한 뒤, 허수부가 0 에 가까운 점만 남깁니다.
+        """
+        with np.errstate(all="ignore"):
+            y = np.asarray(self._func(np.asarray(x, dtype=complex)), dtype=complex)
+            real = np.abs(y.imag) <= 1e-9 * (1 + np.abs(y.real))
+            y = np.where(real & np.isfinite(y), y.real, np.nan)
+        return np.broadcast_to(y, np.shape(x)).copy()
+
+
+_compiled = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_function(text):
+    """입력 문자열을 CompiledFunction 으로 바꿉니다.
+
+    같은 식(예: 'x^2' 와 'x**2')은 정규 키가 같으므로 한 번만 컴파일하고,
+    최근에 쓰인 MAX_COMPILED 개까지 보관합니다.
+    """
+    expr, key = parse_function(normalize(text))
+    with _compiled_lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            _compiled.move_to_end(key)
+            return compiled
+
+    compiled = CompiledFunction(expr)
+    with _compiled_lock:
+        _compiled[key] = compiled
+        while len(_compiled) > MAX_COMPILED:
+            _compiled.popitem(last=False)
+    return compiled
+
+
+def sample_function(compiled, x_min, x_max, num=1000):
+    """그래프용 (x, y) 배열을 만듭니다. 수직 점근선에서는 NaN 으로 선을 끊습니다."""
+    x = np.linspace(x_min, x_max, num)
+    y = compiled(x)
+    for pole in compiled.poles:
+        if x_min < pole < x_max:
+            index = np.searchsorted(x, pole)
+            x = np.insert(x, index, pole)
+            y = np.insert(y, index, np.nan)
+    return x, y
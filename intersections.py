@@ -0,0 +1,175 @@
+"""유리함수와 직선, 또는 두 유리함수의 교점을 구합니다.
+
+이 페이지들에서 다루는 함수는 모두 (px+q)/(rx+s) 꼴로 나타낼 수 있습니다.
+
+- y = (ax+b)/(cx+d)  ->  (a, b, c, d)
+- y = a/(x-h)+k      ->  (k, a-kh, 1, -h)
+- y = mx+n           ->  (m, n, 0, 1)
+
+두 함수 N1/D1 = N2/D2 의 교점은 N1*D2 - N2*D1 = 0 (이차 이하 방정식)의 근 중에서
+분모가 0 이 아닌 것이므로, 표본 배열을 훑지 않고 근의 공식으로 바로 구합니다.
+모든 함수는 NumPy 배열을 받아 여러 매개변수 조합을 한 번에 계산합니다.
+"""
+from fractions import Fraction
+from functools import lru_cache
+from math import isqrt
+
+import numpy as np
+
+from rational_utils import fraction_latex
+
+
+def from_coefficients(a, b, c, d):
+    return a, b, c, d
+
+
+def from_shifted(a, h, k):
+    return k, a - k * h, 1, -h
+
+
+def from_line(m, n):
+    return m, n, 0, 1
+
+
+def equation_coefficients(first, second):
+    """교점의 x 좌표가 만족하는 이차방정식 Ax^2 + Bx + C = 0 의 계수를 구합니다."""
+    p1, q1, r1, s1 = first
+    p2, q2, r2, s2 = second
+    A = p1 * r2 - p2 * r1
+    B = p1 * s2 + q1 * r2 - p2 * s1 - q2 * r1
+    C = q1 * s2 - q2 * s1
+    return A, B, C
+
+
+def solve_quadratic(A, B, C):
+    """Ax^2 + Bx + C = 0 의 실근을 (..., 2) 배열로 구합니다. 근이 없는 자리는 NaN.
+
+    A = 0 이면 일차방정식으로 풀고, 중근은 한 번만 돌려줍니다.
+    """
+    A, B, C = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (A, B, C)))
+    roots = np.full(A.shape + (2,), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = B * B - 4 * A * C
+        quadratic = (A != 0) & (disc >= 0)
+        # 뺄셈에 의한 오차를 피하는 근의 공식: q = -(B + sign(B)√D)/2, x = q/A, C/q
+        sqrt_disc = np.sqrt(np.where(quadratic, disc, 0.0))
+        q = -0.5 * (B + np.where(B >= 0, 1.0, -1.0) * sqrt_disc)
+        first = q / A
+        second = np.where(q != 0, C / q, first)
+        roots[..., 0] = np.where(quadratic, first, np.nan)
+        roots[..., 1] = np.where(quadratic & (disc > 0), second, np.nan)
+
+        linear = (A == 0) & (B != 0)
+        roots[..., 0] = np.where(linear, -C / B, roots[..., 0])
+    return roots
+
+
+def intersections(first, second):
+    """두 함수의 교점 (xs, ys) 를 구합니다. 모양은 (..., 2) 이고 없는 자리는 NaN.
+
+    first, second 는 (p, q, r, s) 이며 각 값은 숫자나 NumPy 배열입니다.
+    """
+    first = tuple(np.asarray(v, dtype=float) for v in first)
+    second = tuple(np.asarray(v, dtype=float) for v in second)
+    xs = solve_quadratic(*equation_coefficients(first, second))
+
+    p1, q1, r1, s1 = (v[..., None] for v in first)
+    r2, s2 = (v[..., None] for v in second[2:])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = r1 * xs + s1
+        d2 = r2 * xs + s2
+        # 어느 한쪽의 분모가 0 이 되는 점은 교점이 아닙니다.
+        scale = np.abs(xs) + 1
+        xs = np.where((np.abs(d1) <= 1e-12 * scale) | (np.abs(d2) <= 1e-12 * scale), np.nan, xs)
+        ys = (p1 * xs + q1) / (r1 * xs + s1)
+    return xs, ys
+
+
+# 제곱 인수는 이 수까지만 찾습니다. 소수점 아래 자리가 많은 입력은 판별식의 분자,
+# 분모가 매우 커서 끝까지 나누어 보면 몇 분씩 걸리기 때문입니다.
+SQUARE_FACTOR_LIMIT = 1000
+
+
+def _simplify_sqrt(value):
+    """양의 분수 value 의 제곱근을 (분수 k, 정수 w) 로 나타냅니다 (√value = k√w).
+
+    SQUARE_FACTOR_LIMIT 이하의 제곱 인수만 근호 밖으로 꺼내므로 w 에 큰 제곱
+    인수가 남을 수 있지만 값은 정확합니다.
+    """
+    inside = value.numerator * value.denominator
+    outside = 1
+    for factor in range(2, SQUARE_FACTOR_LIMIT + 1):
+        square = factor * factor
+        if square > inside:
+            break
+        while inside % square == 0:
+            inside //= square
+            outside *= factor
+    return Fraction(outside, value.denominator), inside
+
+
+def _surd_latex(rational, coefficient, inside):
+    """rational + coefficient·√inside 를 LaTeX 로 나타냅니다."""
+    if coefficient == 0:
+        return fraction_latex(rational)
+    root = f"\\sqrt{{{inside}}}"
+    size = abs(coefficient)
+    if size.numerator != 1:
+        root = f"{size.numerator}{root}"
+    if size.denominator != 1:
+        root = f"\\frac{{{root}}}{{{size.denominator}}}"
+    sign = "-" if coefficient < 0 else "+"
+    if rational == 0:
+        return root if sign == "+" else f"-{root}"
+    return f"{fraction_latex(rational)} {sign} {root}"
+
+
+@lru_cache(maxsize=1024)
+def exact_intersections(first, second):
+    """교점을 분수로 정확하게 구해 LaTeX 문자열 목록으로 돌려줍니다.
+
+    first, second 는 분수 (p, q, r, s) 튜플입니다. 근이 유리수가 아니면
+    좌표를 u ± v√w 꼴로 나타냅니다. 두 함수가 같으면 None 을 돌려줍니다.
+    """
+    A, B, C = equation_coefficients(first, second)
+    if A == 0 and B == 0:
+        return None if C == 0 else []
+
+    p1, q1, r1, s1 = first
+    p2, q2, r2, s2 = second
+
+    def valid(x):
+        return r1 * x + s1 != 0 and r2 * x + s2 != 0
+
+    def point(x):
+        return f"({fraction_latex(x)}, {fraction_latex((p1 * x + q1) / (r1 * x + s1))})"
+
+    if A == 0:
+        x = -C / B
+        return [point(x)] if valid(x) else []
+
+    disc = B * B - 4 * A * C
+    if disc < 0:
+        return []
+    root_num, root_den = isqrt(disc.numerator), isqrt(disc.denominator)
+    if root_num * root_num == disc.numerator and root_den * root_den == disc.denominator:
+        sqrt_disc = Fraction(root_num, root_den)
+        xs = sorted({(-B - sqrt_disc) / (2 * A), (-B + sqrt_disc) / (2 * A)})
+        return [point(x) for x in xs if valid(x)]
+
+    # 무리수 근은 분모가 0 이 될 수 없으므로(분모의 근은 유리수) 모두 교점입니다.
+    # x = u ± t (t² = T) 를 넣은 y = (α + p1·t)/(β + r1·t) 의 분모를 유리화하면
+    # y = Y0 ± Y1·t 이므로 교점을 근호가 하나인 꼴로 나타낼 수 있습니다.
+    center = -B / (2 * A)
+    spread = disc / (4 * A * A)
+    coefficient, inside = _simplify_sqrt(spread)
+    alpha, beta = p1 * center + q1, r1 * center + s1
+    denominator = beta * beta - r1 * r1 * spread
+    y_center = (alpha * beta - p1 * r1 * spread) / denominator
+    y_coefficient = (p1 * beta - alpha * r1) / denominator * coefficient
+    return [
+        f"({_surd_latex(center, sign * coefficient, inside)}, "
+        f"{_surd_latex(y_center, sign * y_coefficient, inside)})"
+        for sign in (-1, 1)
+    ]
@@ -0,0 +1,125 @@
+"""유리함수 퀴즈 문제은행.
+
+문제와 정답은 서버가 시작할 때 한 번만 만들어 유형별 목록에 담아 둡니다.
+문제를 낼 때는 목록에서 번호 하나를 고르기만 하면 되고, 채점은 분수
+(fractions.Fraction)끼리 비교하므로 SymPy 나 그래프 계산이 필요 없습니다.
+"""
+import re
+from fractions import Fraction
+from itertools import product
+
+from rational_utils import linear_latex
+
+COEFFICIENT_RANGE = range(-5, 6)
+# 답으로 받는 수의 꼴: 정수, 소수, 분수. Fraction 은 '1e99999999' 같은 지수 표기도
+# 받아 계산하느라 몇 분씩 멈추므로, 그 전에 이 꼴인지 확인합니다.
+NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?(/\d+)?")
+MAX_ANSWER_LENGTH = 40
+
+QUESTION_TYPES = {
+    "asymptote": "점근선 구하기",
+    "center": "대칭의 중심 구하기",
+    "quadrant": "y=a/x 의 사분면",
+    "domain_range": "정의역과 치역",
+}
+
+QUADRANT_CHOICES = ("제1, 3사분면", "제2, 4사분면")
+
+
+def shift_latex(variable, value):
+    """x-h 처럼 평행이동한 식을 부호에 맞게 나타냅니다."""
+    if value == 0:
+        return variable
+    return f"{variable}-{value}" if value > 0 else f"{variable}+{-value}"
+
+
+def _fractional_questions():
+    """(ax+b)/(cx+d) 꼴의 점근선 및 대칭의 중심 문제를 만듭니다."""
+    asymptote, center = [], []
+    for a, b, c, d in product(COEFFICIENT_RANGE, repeat=4):
+        if c == 0 or a * d - b * c == 0:
+            continue
+        vertical = Fraction(-d, c)
+        horizontal = Fraction(a, c)
+        latex = rf"y=\frac{{{linear_latex(a, b)}}}{{{linear_latex(c, d)}}}"
+        asymptote.append({
+            "latex": latex,
+            "prompt": "수직 점근선 x = ?, 수평 점근선 y = ? 을 구하세요.",
+            "fields": ("수직 점근선 x =", "수평 점근선 y ="),
+            "answer": (vertical, horizontal),
+        })
+        center.append({
+            "latex": latex,
+            "prompt": "그래프의 대칭의 중심 (p, q) 를 구하세요.",
+            "fields": ("p =", "q ="),
+            "answer": (vertical, horizontal),
+        })
+    return asymptote, center
+
+
+def _shifted_questions():
+    """a/(x-h)+k 꼴의 정의역, 치역 문제를 만듭니다."""
+    questions = []
+    for a, h, k in product(COEFFICIENT_RANGE, repeat=3):
+        if a == 0:
+            continue
+        tail = "" if k == 0 else (f"+{k}" if k > 0 else f"{k}")
+        questions.append({
+            "latex": rf"y=\frac{{{a}}}{{{shift_latex('x', h)}}}{tail}",
+            "prompt": "정의역은 x ≠ ?, 치역은 y ≠ ? 인 실수 전체입니다. 빈칸을 채우세요.",
+            "fields": ("정의역: x ≠", "치역: y ≠"),
+            "answer": (Fraction(h), Fraction(k)),
+        })
+    return questions
+
+
+def _quadrant_questions():
+    """y=a/x 의 그래프가 지나는 사분면 문제를 만듭니다."""
+    return [
+        {
+            "latex": rf"y=\frac{{{a}}}{{x}}",
+            "prompt": "그래프가 지나는 사분면을 고르세요.",
+            "choices": QUADRANT_CHOICES,
+            "answer": QUADRANT_CHOICES[0] if a > 0 else QUADRANT_CHOICES[1],
+        }
+        for a in COEFFICIENT_RANGE if a != 0
+    ]
+
+
+def build_bank():
+    """유형별 문제 목록을 담은 딕셔너리를 만듭니다."""
+    asymptote, center = _fractional_questions()
+    return {
+        "asymptote": asymptote,
+        "center": center,
+        "quadrant": _quadrant_questions(),
+        "domain_range": _shifted_questions(),
+    }
+
+
+def parse_number(text):
+    """'1/3', '-2', '0.5' 같은 입력을 분수로 바꿉니다. 잘못된 입력이면 None."""
+    text = text.strip().replace(" ", "")
+    if len(text) > MAX_ANSWER_LENGTH or not NUMBER_PATTERN.fullmatch(text):
+        return None
+    try:
+        return Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def check_answer(question, responses):
+    """학생의 답(문자열 목록 또는 선택지)을 정확한 분수 비교로 채점합니다."""
+    if "choices" in question:
+        return responses == question["answer"]
+    values = [parse_number(text) for text in responses]
+    return all(value == answer for value, answer in zip(values, question["answer"]))
+
+
+def format_answer(question):
+    """정답을 보기 좋은 문자열로 나타냅니다."""
+    if "choices" in question:
+        return question["answer"]
+    return ", ".join(
+        f"{field} {answer}" for field, answer in zip(question["fields"], question["answer"])
+    )
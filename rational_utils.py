@@ -0,0 +1,117 @@
+"""유리함수 페이지들이 함께 사용하는 계산 및 그래프 도구 모음."""
+import os
+from fractions import Fraction
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+from matplotlib import font_manager
+
+# 한글 글꼴이 없는 서버에서도 그래프의 한글이 깨지지 않도록 함께 넣어 둔 글꼴
+KOREAN_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts", "NanumGothic.ttf")
+
+
+def random_coefficients(rng, low=-5, high=5):
+    """y = (ax+b)/(cx+d) 의 정수 계수를 무작위로 만듭니다.
+
+    c = 0 이거나 ad - bc = 0 이면 유리함수가 아니므로 다시 뽑습니다.
+    """
+    while True:
+        a, b, c, d = (rng.randint(low, high) for _ in range(4))
+        if c != 0 and a * d - b * c != 0:
+            return a, b, c, d
+
+
+@lru_cache(maxsize=4096)
+def to_fraction(value):
+    """입력값(정수, 실수)을 분수로 바꿉니다.
+
+    0.1 처럼 실수로 입력된 값이 0.1000000000000000055... 이 되지 않도록
+    십진 표현을 기준으로 변환합니다. 십진 표현 그대로이므로 1.0000001 처럼
+    자릿수가 많은 값도 반올림하지 않습니다.
+    """
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+
+def fraction_latex(value):
+    """분수를 LaTeX 문자열로 나타냅니다. (예: -1/3 -> -\\frac{1}{3})"""
+    if value.denominator == 1:
+        return str(value.numerator)
+    sign = "-" if value < 0 else ""
+    return f"{sign}\\frac{{{abs(value.numerator)}}}{{{value.denominator}}}"
+
+
+def linear_latex(p, q):
+    """px+q 를 LaTeX 문자열로 나타냅니다 (p, q 는 분수)."""
+    if p == 0:
+        return fraction_latex(q)
+    text = {1: "x", -1: "-x"}.get(p, f"{fraction_latex(p)}x")
+    if q > 0:
+        text += f"+{fraction_latex(q)}"
+    elif q < 0:
+        text += fraction_latex(q)
+    return text
+
+
+@lru_cache(maxsize=4096)
+def exact_properties(a, b, c, d):
+    """y = (ax+b)/(cx+d) 의 성질을 분수로 정확하게 계산합니다.
+
+    같은 계수로 다시 호출하면 캐시된 결과를 그대로 돌려주므로 화면을 다시
+    그릴 때마다 계산할 필요가 없습니다. 결과는 모든 호출이 함께 쓰므로 읽기
+    전용 매핑으로 돌려줍니다. kind 는 "invalid"(c=d=0), "linear"(c=0),
+    "constant"(ad-bc=0), "rational" 중 하나입니다.
+    """
+    a, b, c, d = (to_fraction(v) for v in (a, b, c, d))
+    props = {"kind": "rational", "coefficients": (a, b, c, d)}
+    if c == 0 and d == 0:
+        props["kind"] = "invalid"
+        return MappingProxyType(props)
+    if c == 0:
+        props["kind"] = "linear" if a != 0 else "constant"
+        props["latex"] = linear_latex(a / d, b / d)
+        return MappingProxyType(props)
+
+    vertical = -d / c
+    horizontal = a / c
+    if a * d - b * c == 0:
+        props["kind"] = "constant"
+    props.update({
+        "vertical": vertical,
+        "horizontal": horizontal,
+        "center": (vertical, horizontal),
+        "latex": f"\\frac{{{linear_latex(a, b)}}}{{{linear_latex(c, d)}}}",
+        "domain_latex": f"\\{{x \\mid x \\neq {fraction_latex(vertical)}\\}}",
+        "range_latex": f"\\{{y \\mid y \\neq {fraction_latex(horizontal)}\\}}",
+    })
+    return MappingProxyType(props)
+
+
+def sample_curve(a, b, c, d, x_min=-10.0, x_max=10.0, num=500):
+    """수직 점근선을 기준으로 나눈 (x, y) 배열 목록을 돌려줍니다."""
+    vertical_asymptote = -d / c
+    if x_min < vertical_asymptote < x_max:
+        xs = [
+            np.linspace(x_min, vertical_asymptote - 0.01, num),
+            np.linspace(vertical_asymptote + 0.01, x_max, num),
+        ]
+    else:
+        xs = [np.linspace(x_min, x_max, 2 * num)]
+    return [(x, (a * x + b) / (c * x + d)) for x in xs]
+
+
+@lru_cache(maxsize=None)
+def korean_font_rc():
+    """함께 넣어 둔 나눔고딕을 등록하고, 이 글꼴로 그리는 rcParams 설정을 돌려줍니다.
+
+    전역 설정은 바꾸지 않으므로 matplotlib.rc_context(korean_font_rc()) 안에서
+    만든 그림에만 적용됩니다.
+    """
+    font_manager.fontManager.addfont(KOREAN_FONT_PATH)
+    return MappingProxyType({
+        "font.family": font_manager.FontProperties(fname=KOREAN_FONT_PATH).get_name(),
+        # 나눔고딕에는 유니코드 빼기 기호(U+2212)가 없으므로 '-' 를 씁니다.
+        "axes.unicode_minus": False,
+    })
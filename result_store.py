@@ -0,0 +1,252 @@
+"""게임 기록, 로또 번호, 퀴즈 진행 상황을 저장하는 로컬 SQLite 저장소.
+
+- WAL 모드를 사용하므로 기록하는 동안에도 읽기가 막히지 않습니다.
+- 쓰기는 큐에 넣기만 하고 바로 돌아가며, 백그라운드 스레드가 모아서 한 번에
+  기록합니다(write-behind). 그래서 화면을 다시 그리는 동안 쓰기로 기다리지 않습니다.
+- 기록 화면에서 쓰는 조회 결과는 메모리에 캐시하고, 데이터베이스에 새 기록이
+  들어가면(다른 서버 프로세스가 쓴 경우 포함) 무효화합니다.
+"""
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.environ.get(
+    "RESULT_STORE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "results.sqlite3")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_logs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    words TEXT NOT NULL,
+    word_count INTEGER NOT NULL,
+    ended_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_game_logs_count ON game_logs (word_count DESC, ended_at);
+CREATE INDEX IF NOT EXISTS idx_game_logs_player ON game_logs (player, ended_at DESC);
+
+CREATE TABLE IF NOT EXISTS lotto_tickets (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    packed BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lotto_tickets_created ON lotto_tickets (created_at DESC);
+
+CREATE TABLE IF NOT EXISTS quiz_progress (
+    player TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (player, question_type)
+);
+CREATE INDEX IF NOT EXISTS idx_quiz_progress_correct ON quiz_progress (correct DESC);
+"""
+
+
+def pack_ticket(numbers):
+    """1~45 사이의 번호 6개를 45비트 정수 하나로 압축합니다."""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << (number - 1)
+    return mask
+
+
+def unpack_ticket(mask):
+    """pack_ticket 으로 압축한 정수를 오름차순 번호 목록으로 되돌립니다."""
+    return [bit + 1 for bit in range(45) if mask >> bit & 1]
+
+
+def pack_tickets(tickets):
+    return struct.pack(f"<{len(tickets)}Q", *(pack_ticket(numbers) for numbers in tickets))
+
+
+def unpack_tickets(blob):
+    return [unpack_ticket(mask) for mask in struct.unpack(f"<{len(blob) // 8}Q", blob)]
+
+
+class ResultStore:
+    """SQLite(WAL) 기반 저장소. 쓰기는 큐를 거쳐 백그라운드에서 묶어서 처리합니다."""
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=64, flush_interval=0.5, cache_size=256):
+        # 메모리 DB 는 연결마다 따로 만들어지므로 쓰기 스레드의 기록을 읽을 수 없습니다.
+        if path == ":memory:":
+            raise ValueError("ResultStore 에는 파일 경로가 필요합니다.")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+
+        self._queue = queue.Queue()
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+
+        self._writer = threading.Thread(target=self._write_loop, name="result-store-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    # --- 쓰기 (큐에 넣기만 하고 바로 돌아갑니다) ---
+
+    def log_game(self, player, words):
+        """끝말잇기 한 판의 기록을 저장합니다."""
+        self._queue.put((
+            "INSERT INTO game_logs (player, words, word_count, ended_at) VALUES (?, ?, ?, ?)",
+            (player, "\n".join(words), len(words), time.time()),
+        ))
+
+    def save_tickets(self, player, tickets):
+        """한 번에 생성한 로또 번호 묶음을 압축해서 저장합니다."""
+        self._queue.put((
+            "INSERT INTO lotto_tickets (player, created_at, packed) VALUES (?, ?, ?)",
+            (player, time.time(), pack_tickets(tickets)),
+        ))
+
+    def record_answer(self, player, question_type, correct):
+        """퀴즈 한 문제의 채점 결과를 학생별, 유형별 누적 기록에 더합니다."""
+        self._queue.put((
+            "INSERT INTO quiz_progress (player, question_type, correct, total, updated_at) "
+            "VALUES (?, ?, ?, 1, ?) "
+            "ON CONFLICT (player, question_type) DO UPDATE SET "
+            "correct = correct + excluded.correct, total = total + 1, updated_at = excluded.updated_at",
+            (player, question_type, int(correct), time.time()),
+        ))
+
+    def _write_loop(self):
+        connection = self._connect()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_batch(connection, batch)
+            if stop:
+                break
+        connection.close()
+
+    def _write_batch(self, connection, batch):
+        """묶음 하나를 한 트랜잭션으로 기록합니다.
+
+        실패하면(다른 프로세스가 잠근 경우, 디스크 오류 등) 되돌리고 로그만 남겨
+        쓰기 스레드가 멈추지 않게 합니다. 그 묶음의 기록은 버려집니다.
+        """
+        try:
+            connection.execute("BEGIN")
+            for sql, params in batch:
+                connection.execute(sql, params)
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            logger.exception("결과 저장소에 %d건을 기록하지 못했습니다.", len(batch))
+            if connection.in_transaction:
+                try:
+                    connection.execute("ROLLBACK")
+                except sqlite3.Error:
+                    logger.exception("결과 저장소의 트랜잭션을 되돌리지 못했습니다.")
+
+    def close(self):
+        """남은 쓰기를 모두 기록하고 저장소를 닫습니다."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    # --- 읽기 (메모리 캐시를 거칩니다) ---
+
+    def _query(self, sql, params=()):
+        key = (sql, params)
+        with self._read_lock:
+            # data_version 은 다른 연결(이 프로세스의 쓰기 스레드, 다른 서버 프로세스)이
+            # 기록할 때마다 바뀌므로, 이 값이 같으면 캐시된 결과가 아직 유효합니다.
+            version = self._reader.execute("PRAGMA data_version").fetchone()[0]
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+            rows = self._reader.execute(sql, params).fetchall()
+
+        with self._cache_lock:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = (version, rows)
+        return rows
+
+    def word_game_leaderboard(self, limit=10):
+        """이어간 단어 수가 많은 순서로 끝말잇기 기록을 돌려줍니다."""
+        return self._query(
+            "SELECT player, word_count, ended_at FROM game_logs ORDER BY word_count DESC, ended_at LIMIT ?",
+            (limit,),
+        )
+
+    def word_game_history(self, player, limit=10):
+        """한 사람의 최근 끝말잇기 기록(단어 목록 포함)을 돌려줍니다."""
+        rows = self._query(
+            "SELECT words, word_count, ended_at FROM game_logs WHERE player = ? ORDER BY ended_at DESC LIMIT ?",
+            (player, limit),
+        )
+        return [(words.split("\n"), count, ended_at) for words, count, ended_at in rows]
+
+    def recent_tickets(self, limit=5):
+        """최근에 생성된 로또 번호 묶음을 돌려줍니다."""
+        rows = self._query(
+            "SELECT player, created_at, packed FROM lotto_tickets ORDER BY created_at DESC LIMIT ?",
+            (limit,),
+        )
+        return [(player, created_at, unpack_tickets(packed)) for player, created_at, packed in rows]
+
+    def quiz_leaderboard(self, limit=10):
+        """맞힌 문제 수가 많은 순서로 학생별 퀴즈 성적을 돌려줍니다."""
+        return self._query(
+            "SELECT player, SUM(correct) AS correct, SUM(total) AS total FROM quiz_progress "
+            "GROUP BY player ORDER BY correct DESC LIMIT ?",
+            (limit,),
+        )
+
+    def quiz_progress(self, player):
+        """한 학생의 유형별 (맞힌 수, 푼 수)를 돌려줍니다."""
+        rows = self._query(
+            "SELECT question_type, correct, total FROM quiz_progress WHERE player = ?",
+            (player,),
+        )
+        return {question_type: (correct, total) for question_type, correct, total in rows}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """모든 페이지와 세션이 함께 쓰는 저장소 하나를 돌려줍니다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore()
+        return _store
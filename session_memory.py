@@ -0,0 +1,259 @@
+"""세션별 메모리 사용량을 추적하고, 오래 쉬는 세션을 정리합니다.
+
+각 페이지는 실행될 때 track_session(페이지 이름, 페이지가 쓰는 키) 를 부릅니다.
+그러면 이 세션의 키별 대략적인 크기와 마지막 사용 시각이 기록되고, 정리 정책이
+적용됩니다.
+
+- COMPACT_AFTER 초 동안 쉰 세션: 큰 값(예: 끝말잇기 단어 기록)을 디스크로 옮기고
+  자리표시자만 남깁니다. 그 세션이 다시 돌아오면 자동으로 되살립니다.
+- EVICT_AFTER 초 동안 쉰 세션: 버려진 것으로 보고 페이지가 등록한 값을 지웁니다.
+  끝난 세션은 디스크에 옮긴 파일도 바로 지웁니다.
+
+세션은 session_id 로 기록하고, 정리할 때 스트림릿 런타임의 세션 관리자에서 그
+세션의 상태를 찾습니다. (st.session_state 는 실행마다 새로 만들어지는 감싼
+객체라 붙잡아 둘 수 없습니다.)
+
+정리는 다른 세션의 실행 스레드에서 일어나므로, 세션마다 잠금을 두고 그 세션의
+실행은 restore_session(또는 track_session)에서 같은 잠금을 잡습니다. 값을
+디스크로 옮기는 일은 잠금을 잡은 채 쉰 시간을 다시 확인한 뒤에만 하고, 키를
+지우는 일은 표시만 해 두었다가 그 세션이 다시 실행될 때 그 세션의 스레드에서
+합니다. 위젯 콜백은 페이지 본문보다 먼저 실행되므로, 세션 상태를 읽는 콜백은
+restore_session 을 먼저 불러야 합니다.
+
+설정은 환경 변수 SESSION_COMPACT_AFTER, SESSION_EVICT_AFTER, SESSION_SPILL_MIN_BYTES
+로 바꿀 수 있습니다.
+"""
+import os
+import pickle
+import sys
+import threading
+import time
+
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+COMPACT_AFTER = float(os.environ.get("SESSION_COMPACT_AFTER", 30 * 60))
+EVICT_AFTER = float(os.environ.get("SESSION_EVICT_AFTER", 6 * 60 * 60))
+SPILL_MIN_BYTES = int(os.environ.get("SESSION_SPILL_MIN_BYTES", 64 * 1024))
+SWEEP_INTERVAL = 60.0
+
+SPILL_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sessions")
+
+
+def approx_size(obj, _seen=None):
+    """객체가 차지하는 메모리를 대략 계산합니다 (컨테이너는 안의 값까지 더함)."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):  # NumPy 배열
+        return sys.getsizeof(obj) + (0 if getattr(obj, "base", None) is not None else nbytes)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approx_size(k, _seen) + approx_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item, _seen) for item in obj)
+    return size
+
+
+class SpilledValue:
+    """디스크로 옮긴 세션 값 대신 세션에 남겨 두는 자리표시자."""
+
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+
+    def load(self):
+        with open(self.path, "rb") as f:
+            value = pickle.load(f)
+        os.remove(self.path)
+        return value
+
+
+def _session_manager():
+    """스트림릿 런타임의 세션 관리자를 돌려줍니다. 서버 밖(테스트 등)에서는 None."""
+    if not runtime.exists():
+        return None
+    return getattr(runtime.get_instance(), "_session_mgr", None)
+
+
+class SessionRegistry:
+    """서버의 모든 세션에 대한 메모리 사용 기록과 정리 정책."""
+
+    def __init__(self, compact_after=COMPACT_AFTER, evict_after=EVICT_AFTER,
+                 spill_min_bytes=SPILL_MIN_BYTES, spill_directory=SPILL_DIRECTORY):
+        self.compact_after = compact_after
+        self.evict_after = evict_after
+        self.spill_min_bytes = spill_min_bytes
+        self.spill_directory = spill_directory
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+
+    def _entry(self, session_id):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                entry = self._sessions[session_id] = {
+                    "page": None, "last_seen": time.time(), "pages": {}, "spillable": set(),
+                    "spill_paths": set(), "spilled": 0, "evicted": False, "lock": threading.Lock(),
+                }
+            return entry
+
+    def track(self, page, keys=(), spillable=()):
+        """현재 세션을 기록하고, 디스크로 옮겨 둔 값이 있으면 되살립니다."""
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        self.restore(spillable)
+        state = st.session_state
+
+        sizes = {key: approx_size(state[key]) for key in keys if key in state}
+        now = time.time()
+        entry = self._entry(ctx.session_id)
+        with self._lock:
+            entry["page"] = page
+            entry["pages"][page] = sizes
+            entry["spillable"].update(spillable)
+
+        if now - self._last_sweep > SWEEP_INTERVAL:
+            self._last_sweep = now
+            self.sweep(now)
+
+    def restore(self, keys=()):
+        """현재 세션에서 디스크로 옮겨 둔 keys 의 값을 되살립니다.
+
+        정리하기로 표시된 세션이면 먼저 등록된 값을 지웁니다. 이 세션의 스레드에서
+        부르므로 세션 상태를 바꿔도 안전합니다.
+        """
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        entry = self._entry(ctx.session_id)
+        state = st.session_state
+        with entry["lock"]:
+            entry["last_seen"] = time.time()
+            if entry["evicted"]:
+                self._evict(state, entry)
+            for key in keys:
+                value = state.get(key)
+                if isinstance(value, SpilledValue):
+                    state[key] = value.load()
+                    entry["spill_paths"].discard(value.path)
+            entry["spilled"] = sum(
+                value.size for value in (state.get(key) for key in entry["spillable"])
+                if isinstance(value, SpilledValue)
+            )
+
+    def _spill(self, session_id, entry, state, key):
+        value = state[key]
+        if isinstance(value, SpilledValue):
+            return value.size
+        size = approx_size(value)
+        if size < self.spill_min_bytes:
+            return 0
+        os.makedirs(self.spill_directory, exist_ok=True)
+        path = os.path.join(self.spill_directory, f"{session_id}_{abs(hash(key))}.pkl")
+        with open(path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        state[key] = SpilledValue(path, size)
+        entry["spill_paths"].add(path)
+        return size
+
+    def _evict(self, state, entry):
+        """등록된 값과 디스크로 옮긴 파일을 지웁니다. state 는 그 세션의 스레드에서만 넘깁니다."""
+        if state is not None:
+            for sizes in entry["pages"].values():
+                for key in sizes:
+                    if key in state:
+                        del state[key]
+            entry["pages"] = {}
+            entry["evicted"] = False
+        for path in entry["spill_paths"]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        entry["spill_paths"] = set()
+
+    def sweep(self, now=None):
+        """오래 쉰 세션의 큰 값은 디스크로 옮기고, 버려진 세션은 정리합니다."""
+        now = time.time() if now is None else now
+        manager = _session_manager()
+        if manager is None:
+            return
+        with self._lock:
+            sessions = list(self._sessions.items())
+
+        for session_id, entry in sessions:
+            info = manager.get_session_info(session_id)
+            with entry["lock"]:
+                if info is None:  # 끝난 세션은 상태가 이미 없으므로 파일만 지웁니다.
+                    self._evict(None, entry)
+                    with self._lock:
+                        self._sessions.pop(session_id, None)
+                    continue
+                # 잠금을 잡은 뒤에 다시 확인하므로, 그 사이 돌아온 세션은 건드리지 않습니다.
+                idle = now - entry["last_seen"]
+                if idle <= self.compact_after:
+                    continue
+                state = info.session.session_state
+                spilled = 0
+                for key in entry["spillable"]:
+                    try:
+                        spilled += self._spill(session_id, entry, state, key)
+                    except KeyError:
+                        pass
+                entry["spilled"] = spilled
+                if idle > self.evict_after:
+                    entry["evicted"] = True
+
+    def report(self):
+        """관리자 화면용 요약: 세션 목록과 페이지별 합계."""
+        now = time.time()
+        sessions, pages = [], {}
+        with self._lock:
+            entries = list(self._sessions.items())
+        for session_id, entry in entries:
+            total = 0
+            for page, sizes in entry["pages"].items():
+                page_bytes = sum(sizes.values())
+                total += page_bytes
+                pages[page] = pages.get(page, 0) + page_bytes
+            sessions.append({
+                "세션": session_id[:8],
+                "현재 페이지": entry["page"],
+                "쉰 시간(초)": int(now - entry["last_seen"]),
+                "사용량(KB)": round(total / 1024, 1),
+                "디스크로 옮김(KB)": round(entry.get("spilled", 0) / 1024, 1),
+            })
+        sessions.sort(key=lambda row: row["사용량(KB)"], reverse=True)
+        return sessions, pages
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """서버에 하나뿐인 세션 기록을 돌려줍니다."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SessionRegistry()
+        return _registry
+
+
+def track_session(page, keys=(), spillable=()):
+    """페이지 맨 위에서 부르는 함수. keys 는 이 페이지가 st.session_state 에 두는 키입니다."""
+    get_registry().track(page, keys, spillable)
+
+
+def restore_session(spillable=()):
+    """디스크로 옮겨 둔 값을 되살립니다. 세션 상태를 읽는 위젯 콜백의 맨 앞에서 부릅니다."""
+    get_registry().restore(spillable)
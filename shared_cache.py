@@ -0,0 +1,330 @@
+"""여러 스트림릿 서버 프로세스가 함께 쓰는 캐시.
+
+- DiskCache: 바이트 값을 로컬 디스크에 저장합니다. 쓰기는 임시 파일에 기록한 뒤
+  이름을 바꾸는(atomic rename) 방식이라 다른 프로세스가 반쯤 쓴 파일을 읽지
+  않으며, 정리(eviction)는 파일 잠금으로 한 프로세스만 수행합니다.
+- SharedArrayCache: NumPy 배열을 multiprocessing.shared_memory 에 올려 두고
+  다른 프로세스가 복사 없이 붙어서 읽습니다.
+
+두 캐시 모두 크기 제한을 넘으면 가장 오래 쓰이지 않은 항목부터 지우며(LRU),
+외부 서비스 없이 동작합니다. 새로 뜬 프로세스도 이미 채워진 캐시를 바로 씁니다.
+전체 크기는 잠금 파일에 기록한 카운터로 어림하므로, 디렉터리를 훑는 정리는
+제한을 넘었을 때만 합니다.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+DEFAULT_DIRECTORY = os.environ.get(
+    "SHARED_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cache")
+)
+
+
+def _digest(key):
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+
+class _LRUDirectory:
+    """파일 하나가 항목 하나인 디렉터리. 파일의 수정 시각을 마지막 사용 시각으로 씁니다.
+
+    잠금 파일의 앞 8바이트에는 모든 프로세스가 함께 쓰는 전체 크기 카운터를
+    둡니다. 같은 키를 다시 쓰면 두 번 더해지므로 카운터는 실제보다 크거나 같고,
+    제한을 넘으면 디렉터리를 훑어 실제 크기로 바로잡습니다.
+    """
+
+    suffix = ".bin"
+    # 정리할 때는 제한의 이 비율까지 줄여서, 가득 찬 뒤에도 쓸 때마다 훑지 않게 합니다.
+    low_water = 0.9
+
+    def __init__(self, directory, max_bytes):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock_path = os.path.join(directory, ".lock")
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, _digest(key) + self.suffix)
+
+    def _count(self, hit):
+        with self._counter_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def _write_atomic(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _entry_size(self, path):
+        return os.path.getsize(path)
+
+    def _remove(self, path):
+        os.unlink(path)
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.suffix):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, self._entry_size(entry.path), entry.path))
+            except (FileNotFoundError, ValueError):
+                continue
+        return entries
+
+    def _evict(self):
+        """전체 크기가 max_bytes * low_water 이하가 될 때까지 오래된 항목부터 지우고
+        남은 크기를 돌려줍니다. 잠금을 잡은 상태에서 부릅니다."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return total
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes * self.low_water:
+                break
+            try:
+                self._remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
+
+    def _added(self, nbytes):
+        """새로 쓴 nbytes 를 공유 카운터에 더하고, 제한을 넘었을 때만 정리합니다."""
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            data = os.pread(fd, 8, 0)
+            if len(data) == 8:
+                total = struct.unpack("<Q", data)[0] + nbytes
+            else:  # 카운터가 없으면(처음 쓰는 디렉터리) 훑어서 만듭니다.
+                total = self.max_bytes + 1
+            if total > self.max_bytes:
+                total = self._evict()
+            os.pwrite(fd, struct.pack("<Q", total), 0)
+        finally:
+            os.close(fd)  # 파일을 닫으면 잠금도 풀립니다.
+
+    def stats(self):
+        """이 프로세스의 적중/실패 횟수와 캐시 전체의 항목 수, 크기를 돌려줍니다."""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+
+class DiskCache(_LRUDirectory):
+    """바이트 값을 저장하는 디스크 캐시."""
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            self._count(False)
+            return default
+        self._touch(path)
+        self._count(True)
+        return value
+
+    def set(self, key, value):
+        self._write_atomic(self._path(key), value)
+        self._added(len(value))
+
+
+def _attach(name):
+    """공유 메모리에 붙습니다. 이 프로세스가 끝날 때 지워지지 않도록 추적에서 뺍니다."""
+    segment = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _unlink(name):
+    """공유 메모리를 지웁니다. 없으면 아무것도 하지 않습니다.
+
+    SharedMemory 는 붙을 때 추적에 등록하고 unlink 할 때 등록을 빼므로, 여기서는
+    _attach 를 쓰지 않아야 추적기가 같은 이름을 두 번 빼려다 오류를 남기지 않습니다.
+    """
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+
+class SharedArrayCache(_LRUDirectory):
+    """NumPy 배열을 공유 메모리에 저장하는 캐시.
+
+    배열의 모양, 자료형, 공유 메모리 이름은 디렉터리의 작은 JSON 파일에 기록하고,
+    LRU 정리도 그 파일들을 기준으로 합니다. 각 프로세스는 붙어 있는 공유 메모리를
+    메타 파일의 inode 와 함께 기억해 두었다가, 다른 프로세스가 그 항목을 지우거나
+    새로 쓰면 놓아 줍니다. 그래서 실제 공유 메모리 사용량도 max_bytes 를 따릅니다.
+    """
+
+    suffix = ".meta"
+    prune_interval = 10.0
+
+    def __init__(self, directory, max_bytes):
+        super().__init__(directory, max_bytes)
+        # 같은 서버의 다른 캐시 디렉터리와 이름이 겹치지 않도록 접두어를 붙입니다.
+        self.prefix = "sc" + _digest(os.path.abspath(directory))[:8]
+        self._segments = {}  # 이름 -> (공유 메모리, 메타 파일 경로, 메타 파일 inode)
+        self._retired = []
+        self._segments_lock = threading.RLock()
+        self._last_prune = time.monotonic()
+
+    def _read_meta(self, path):
+        with open(path) as f:
+            return json.load(f)
+
+    def _entry_size(self, path):
+        return self._read_meta(path)["nbytes"]
+
+    def _release(self, name):
+        """이 프로세스가 붙어 있던 공유 메모리를 놓습니다."""
+        with self._segments_lock:
+            entry = self._segments.pop(name, None)
+            if entry is not None:
+                self._retired.append(entry[0])
+            still_used = []
+            for segment in self._retired:
+                try:
+                    segment.close()
+                except BufferError:  # 돌려준 배열이 아직 쓰이는 중이면 다음에 다시 닫습니다.
+                    still_used.append(segment)
+            self._retired = still_used
+
+    def _prune(self):
+        """다른 프로세스가 지우거나 새로 쓴 항목의 공유 메모리를 놓습니다."""
+        now = time.monotonic()
+        if now - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = now
+        with self._segments_lock:
+            for name, (_, path, inode) in list(self._segments.items()):
+                try:
+                    current = os.stat(path).st_ino
+                except FileNotFoundError:
+                    current = None
+                if current is None or current != inode:
+                    self._release(name)
+            self._release(None)  # 전에 닫지 못한 것들만 다시 닫아 봅니다.
+
+    def _remove(self, path):
+        meta = self._read_meta(path)
+        os.unlink(path)
+        self._release(meta["name"])
+        _unlink(meta["name"])
+
+    def get(self, key):
+        """저장된 배열을 읽기 전용 뷰로 돌려줍니다. 없으면 None."""
+        self._prune()
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                inode = os.fstat(f.fileno()).st_ino
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self._count(False)
+            return None
+
+        name = meta["name"]
+        with self._segments_lock:
+            entry = self._segments.get(name)
+            if entry is not None and entry[2] == inode:
+                segment = entry[0]
+            else:
+                # 처음 읽거나, 다른 프로세스가 그 사이에 새로 쓴 항목입니다.
+                self._release(name)
+                try:
+                    segment = _attach(name)
+                except FileNotFoundError:
+                    self._count(False)
+                    return None
+                self._segments[name] = (segment, path, inode)
+        self._touch(path)
+        self._count(True)
+
+        # frombuffer 로 만든 배열은 공유 메모리를 붙잡고 있으므로, 배열이 쓰이는 동안
+        # close() 가 BufferError 를 내고 매핑이 풀리지 않습니다.
+        count = int(np.prod(meta["shape"], dtype=np.int64))
+        array = np.frombuffer(segment.buf, dtype=meta["dtype"], count=count).reshape(meta["shape"])
+        array.flags.writeable = False
+        return array
+
+    def set(self, key, array):
+        array = np.ascontiguousarray(array)
+        path = self._path(key)
+        name = f"{self.prefix}_{_digest(key)[:20]}"
+        self._release(name)
+        try:
+            segment = shared_memory.SharedMemory(name=name, create=True, size=max(array.nbytes, 1))
+        except FileExistsError:
+            # 같은 키를 다시 쓰거나 정리 도중 중단되어 남은 공유 메모리는 지우고 다시 만듭니다.
+            _unlink(name)
+            segment = shared_memory.SharedMemory(name=name, create=True, size=max(array.nbytes, 1))
+        resource_tracker.unregister(segment._name, "shared_memory")
+        np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+
+        meta = {"name": name, "shape": list(array.shape), "dtype": array.dtype.str, "nbytes": array.nbytes}
+        self._write_atomic(path, json.dumps(meta).encode("utf-8"))
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:  # 그 사이 다른 프로세스가 정리한 경우
+            inode = None
+        with self._segments_lock:
+            self._segments[name] = (segment, path, inode)
+        self._added(array.nbytes)
+
+
+_disk_cache = None
+_array_cache = None
+_singleton_lock = threading.Lock()
+
+
+def get_disk_cache(max_bytes=256 * 1024 * 1024):
+    """모든 페이지가 함께 쓰는 바이트 캐시를 돌려줍니다."""
+    global _disk_cache
+    with _singleton_lock:
+        if _disk_cache is None:
+            _disk_cache = DiskCache(os.path.join(DEFAULT_DIRECTORY, "bytes"), max_bytes)
+        return _disk_cache
+
+
+def get_array_cache(max_bytes=512 * 1024 * 1024):
+    """모든 페이지가 함께 쓰는 배열 캐시를 돌려줍니다."""
+    global _array_cache
+    with _singleton_lock:
+        if _array_cache is None:
+            _array_cache = SharedArrayCache(os.path.join(DEFAULT_DIRECTORY, "arrays"), max_bytes)
+        return _array_cache
@@ -0,0 +1,152 @@
+"""y = a/(x-h)+k 의 매개변수를 바꿔 가며 그래프 애니메이션(GIF/MP4)을 만듭니다.
+
+축, 격자, 움직이지 않는 점근선은 배경으로 한 번만 그려 두고(blitting),
+프레임마다 곡선처럼 바뀌는 부분만 다시 그립니다. 프레임은 만들어지는 대로
+인코더에 바로 넘깁니다.
+"""
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from shared_cache import get_array_cache, get_disk_cache
+
+X_RANGE = (-10.0, 10.0)
+POLE_GAP = 0.1
+
+
+def sweep_values(param, values, a=1.0, h=0.0, k=0.0, num=800):
+    """모든 프레임의 y 값을 한 번에 계산합니다.
+
+    결과는 (x, Y) 이며 Y[i] 가 i 번째 프레임의 곡선입니다. 수직 점근선 근처는
+    NaN 으로 두어 곡선이 끊어져 보이게 합니다. 계산한 Y 는 공유 메모리 캐시에
+    두어 다른 서버 프로세스도 그대로 사용합니다.
+    """
+    x = np.linspace(*X_RANGE, num)
+    values = np.asarray(values, dtype=float)
+    key = ("sweep_values", param, values.tobytes(), a, h, k, num)
+    cached = get_array_cache().get(key)
+    if cached is not None:
+        return x, cached
+
+    a_ = values[:, None] if param == "a" else a
+    h_ = values[:, None] if param == "h" else h
+    k_ = values[:, None] if param == "k" else k
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Y = a_ / (x - h_) + k_
+    Y = np.broadcast_to(Y, (len(values), num)).copy()
+    Y[np.broadcast_to(np.abs(x - h_) < POLE_GAP, Y.shape)] = np.nan
+    get_array_cache().set(key, Y)
+    return x, Y
+
+
+def iter_frames(param, values, a=1.0, h=0.0, k=0.0, figsize=(5, 4), dpi=80):
+    """프레임을 RGB 배열로 하나씩 만들어 돌려주는 생성기입니다."""
+    x, Y = sweep_values(param, values, a, h, k)
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.set_xlim(*X_RANGE)
+    ax.set_ylim(-10, 10)
+    ax.axhline(0, color='black', linewidth=1)
+    ax.axvline(0, color='black', linewidth=1)
+    ax.grid(True, linestyle=':', alpha=0.6)
+
+    # 바뀌는 매개변수와 관계없는 점근선은 배경에 그대로 둡니다.
+    vline = ax.axvline(h, color='red', linestyle='--', animated=(param == "h"))
+    hline = ax.axhline(k, color='green', linestyle='--', animated=(param == "k"))
+    curve, = ax.plot([], [], color='blue', animated=True)
+    label = ax.text(0.02, 0.95, "", transform=ax.transAxes, animated=True)
+
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    for value, y in zip(values, Y):
+        canvas.restore_region(background)
+        curve.set_data(x, y)
+        label.set_text(f"{param} = {value:g}")
+        if param == "h":
+            vline.set_xdata([value, value])
+            ax.draw_artist(vline)
+        elif param == "k":
+            hline.set_ydata([value, value])
+            ax.draw_artist(hline)
+        ax.draw_artist(curve)
+        ax.draw_artist(label)
+        yield np.asarray(canvas.buffer_rgba())[..., :3].copy()
+
+
+def ffmpeg_available():
+    """MP4 로 저장할 수 있는지(ffmpeg 가 설치되어 있는지) 확인합니다."""
+    return shutil.which(rcParams["animation.ffmpeg_path"]) is not None
+
+
+def encode_gif(frames, fps=20):
+    """프레임을 GIF 바이트로 인코딩합니다.
+
+    각 프레임은 받는 즉시 팔레트 이미지로 줄여 두어 메모리를 아낍니다.
+    """
+    images = [Image.fromarray(frame).quantize(colors=64) for frame in frames]
+    buffer = io.BytesIO()
+    images[0].save(
+        buffer, format="GIF", save_all=True, append_images=images[1:],
+        duration=int(1000 / fps), loop=0
+    )
+    return buffer.getvalue()
+
+
+def encode_mp4(frames, fps=20):
+    """프레임을 ffmpeg 에 파이프로 흘려 보내 MP4 바이트로 인코딩합니다."""
+    frames = iter(frames)
+    first = next(frames)
+    height, width, _ = first.shape
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "sweep.mp4")
+        command = [
+            rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-", "-vcodec", "libx264", "-pix_fmt", "yuv420p", path,
+        ]
+        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        process.stdin.write(first.tobytes())
+        for frame in frames:
+            process.stdin.write(frame.tobytes())
+        process.stdin.close()
+        if process.wait() != 0:
+            raise RuntimeError("ffmpeg 인코딩에 실패했습니다.")
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def render_sweep(param, start, stop, frames=100, a=1.0, h=0.0, k=0.0, fmt="gif", fps=20):
+    """param 을 start 부터 stop 까지 바꾸는 애니메이션을 fmt 형식의 바이트로 만듭니다.
+
+    만든 결과는 디스크 캐시에 저장해 모든 서버 프로세스가 재사용합니다. 바뀌는
+    매개변수의 현재 값은 애니메이션에 쓰이지 않으므로 키에서 뺍니다.
+    """
+    fixed = {"a": a, "h": h, "k": k}
+    fixed[param] = None
+    key = ("sweep", param, start, stop, frames, fixed["a"], fixed["h"], fixed["k"], fmt, fps)
+    cache = get_disk_cache()
+    movie = cache.get(key)
+    if movie is not None:
+        return movie
+
+    values = np.linspace(start, stop, frames)
+    generator = iter_frames(param, values, a, h, k)
+    if fmt == "mp4":
+        movie = encode_mp4(generator, fps)
+    else:
+        movie = encode_gif(generator, fps)
+    cache.set(key, movie)
+    return movie
@@ -0,0 +1,29 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from function_parser import compile_function, sample_function
+
+
+@pytest.mark.parametrize("text", ["log(-1)", "sqrt(-1)", "x+sqrt(-4)", "(-8)^(1/3)*x", "sqrt(-x^2-1)"])
+def test_complex_values_are_rejected(text):
+    with pytest.raises(ValueError):
+        compile_function(text)
+
+
+def test_values_outside_the_real_domain_are_nan():
+    x = np.array([-4.0, 0.0, 4.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        y = compile_function("sqrt(x)+1")(x)
+    assert np.isnan(y[0])
+    np.testing.assert_allclose(y[1:], [1, 3])
+
+
+def test_repeated_poles_are_listed_once():
+    assert compile_function("1/(x-1)^2").poles == (1.0,)
+    compiled = compile_function("1/((x-1)(x+1))^2")
+    assert compiled.poles == (-1.0, 1.0)
+    x, y = sample_function(compiled, -5, 5, num=10)
+    assert np.isnan(y).sum() == 2
@@ -0,0 +1,98 @@
+from fractions import Fraction
+
+import numpy as np
+
+from intersections import (
+    exact_intersections,
+    from_coefficients,
+    from_line,
+    from_shifted,
+    intersections,
+    solve_quadratic,
+)
+
+
+def fractions(*values):
+    return tuple(Fraction(v) for v in values)
+
+
+def test_solve_quadratic_two_roots_double_root_and_linear():
+    roots = solve_quadratic([1, 1, 0, 1], [-3, -2, 2, 0], [2, 1, -4, 1])
+    np.testing.assert_allclose(np.sort(roots[0]), [1, 2])
+    # 중근은 한 번만 돌려줍니다.
+    np.testing.assert_allclose(roots[1, 0], 1)
+    assert np.isnan(roots[1, 1])
+    # A = 0 이면 일차방정식의 근 하나
+    np.testing.assert_allclose(roots[2, 0], 2)
+    assert np.isnan(roots[2, 1])
+    # 실근이 없는 경우
+    assert np.isnan(roots[3]).all()
+
+
+def test_tangent_line_has_one_intersection():
+    # y = 1/x 와 y = -x + 2 는 (1, 1) 에서 접합니다.
+    curve, line = fractions(0, 1, 1, 0), fractions(-1, 2, 0, 1)
+    assert exact_intersections(curve, line) == ["(1, 1)"]
+
+    xs, ys = intersections(curve, line)
+    np.testing.assert_allclose(xs[0], 1)
+    np.testing.assert_allclose(ys[0], 1)
+    assert np.isnan(xs[1])
+
+
+def test_root_at_hole_is_excluded():
+    # y = (x+1)/(x-1) 과 y = 2x - 1: 2x^2 - 4x = 0 의 두 근이 모두 교점입니다.
+    assert exact_intersections(fractions(1, 1, 1, -1), fractions(2, -1, 0, 1)) == ["(0, -1)", "(2, 3)"]
+
+    # y = (2x-2)/(x-1) 은 x = 1 에 구멍이 있는 y = 2 이므로, y = 2x 와의 방정식의
+    # 근 x = 1 은 교점이 아닙니다.
+    curve, line = fractions(2, -2, 1, -1), fractions(2, 0, 0, 1)
+    assert exact_intersections(curve, line) == []
+    xs, _ = intersections(curve, line)
+    assert np.isnan(xs).all()
+
+
+def test_linear_equation_case():
+    # 수평 점근선과 같은 기울기 0 의 직선은 교점 방정식이 일차가 됩니다.
+    curve, line = from_shifted(*fractions(1, 0, 2)), from_line(*fractions(0, 3))
+    assert exact_intersections(curve, line) == ["(1, 3)"]
+
+    xs, ys = intersections(curve, line)
+    np.testing.assert_allclose(xs[0], 1)
+    np.testing.assert_allclose(ys[0], 3)
+
+
+def test_identical_and_parallel_curves():
+    curve = from_coefficients(*fractions(2, 1, 1, -1))
+    assert exact_intersections(curve, fractions(4, 2, 2, -2)) is None
+    # 수평 점근선 위의 직선은 만나지 않습니다.
+    assert exact_intersections(curve, from_line(*fractions(0, 2))) == []
+
+
+def test_irrational_points_include_y():
+    # y = 1/x 와 y = -x + 3: x = (3 ∓ √5)/2, y = 3 - x
+    points = exact_intersections(fractions(0, 1, 1, 0), fractions(-1, 3, 0, 1))
+    assert points == [
+        "(\\frac{3}{2} - \\frac{\\sqrt{5}}{2}, \\frac{3}{2} + \\frac{\\sqrt{5}}{2})",
+        "(\\frac{3}{2} + \\frac{\\sqrt{5}}{2}, \\frac{3}{2} - \\frac{\\sqrt{5}}{2})",
+    ]
+
+
+def test_many_decimal_inputs_are_fast():
+    # 예전에는 제곱 인수를 끝까지 찾느라 수십 초가 걸리던 입력입니다.
+    curve = fractions("4.91234", "9.93217", "8.73123", "-9.84321")
+    line = from_line(*fractions("9.93511", "9.49877"))
+    points = exact_intersections(curve, line)
+    assert len(points) == 2
+
+    xs, _ = intersections(curve, line)
+    assert np.isfinite(xs).all()
+
+
+def test_vectorized_parameters():
+    # y = a/x 와 y = 1 을 a 여러 개에 대해 한 번에 풉니다.
+    a = np.array([1.0, 2.0, -3.0])
+    xs, ys = intersections(from_shifted(a, 0, 0), from_line(0, 1))
+    np.testing.assert_allclose(xs[:, 0], a)
+    np.testing.assert_allclose(ys[:, 0], 1)
+    assert np.isnan(xs[:, 1]).all()
@@ -0,0 +1,29 @@
+import time
+from fractions import Fraction
+
+from quiz_bank import build_bank, check_answer, parse_number
+
+
+def test_parse_number_accepts_integers_decimals_and_fractions():
+    assert parse_number("-2") == -2
+    assert parse_number(" 0.5 ") == Fraction(1, 2)
+    assert parse_number("- 1 / 3") == Fraction(-1, 3)
+    assert parse_number("1/0") is None
+    assert parse_number("") is None
+    assert parse_number("x") is None
+
+
+def test_parse_number_rejects_exponent_notation_quickly():
+    start = time.perf_counter()
+    for text in ("1e99999999", "1e3000000", "1E5", "2.5e-3", "inf", "nan"):
+        assert parse_number(text) is None
+    assert parse_number("1" * 1000) is None
+    assert time.perf_counter() - start < 0.1
+
+
+def test_check_answer_grades_exactly():
+    question = build_bank()["center"][0]
+    correct = [str(value) for value in question["answer"]]
+    assert check_answer(question, correct)
+    # 지수 표기는 계산하지 않고 틀린 답으로 처리합니다.
+    assert not check_answer(question, ["1e99999999"] * len(correct))
@@ -0,0 +1,129 @@
+"""끝말잇기 힌트(자동 완성)를 위한 접두어 색인.
+
+단어 목록은 사전순으로 정렬해 두고, 앞 1~2글자 접두어마다 빈도가 높은 단어
+번호를 미리 골라 둡니다. 짧은 접두어는 미리 고른 목록을 앞에서부터 보면서
+이미 사용한 단어(집합)만 건너뛰고, 긴 접두어는 bisect 로 찾은 좁은 범위에서
+빈도순으로 고릅니다. 어느 쪽도 사용한 단어 목록 전체를 훑지 않습니다.
+
+단어 목록 파일은 한 줄에 '단어' 또는 '단어<TAB>빈도' 형식입니다.
+"""
+import heapq
+import os
+import pickle
+import threading
+from array import array
+from bisect import bisect_left
+
+from shared_cache import get_disk_cache
+
+DEFAULT_PATH = os.environ.get(
+    "WORD_LIST_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "words.txt")
+)
+
+SHORT_PREFIX = 2
+TOP_CAP = 64
+
+
+class WordIndex:
+    """정렬된 단어 배열과 짧은 접두어별 빈도순 후보 목록."""
+
+    def __init__(self, entries):
+        entries = sorted(
+            (word, freq) for word, freq in entries if len(word) >= 2
+        )
+        self.words = []
+        self.freq = array("l")
+        for word, freq in entries:
+            if self.words and self.words[-1] == word:
+                self.freq[-1] = max(self.freq[-1], freq)
+                continue
+            self.words.append(word)
+            self.freq.append(freq)
+
+        # 접두어 -> 빈도가 높은 순서의 단어 번호 (최대 TOP_CAP 개)
+        buckets = {}
+        for index, word in enumerate(self.words):
+            for length in range(1, SHORT_PREFIX + 1):
+                buckets.setdefault(word[:length], []).append(index)
+        self.top = {
+            prefix: array("l", heapq.nlargest(TOP_CAP, indices, key=self.freq.__getitem__))
+            for prefix, indices in buckets.items()
+        }
+
+    def __len__(self):
+        return len(self.words)
+
+    def _range(self, prefix):
+        lo = bisect_left(self.words, prefix)
+        hi = bisect_left(self.words, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+    def suggest(self, prefix, used=(), k=5):
+        """prefix 로 시작하고 used 에 없는 단어를 빈도순으로 최대 k 개 돌려줍니다."""
+        if not prefix:
+            return []
+        if len(prefix) <= SHORT_PREFIX:
+            candidates = self.top.get(prefix, ())
+            result = [self.words[i] for i in candidates if self.words[i] not in used][:k]
+            # 미리 고른 후보가 모두 사용된 경우에만 전체 범위를 봅니다.
+            if len(result) == k or len(candidates) < TOP_CAP:
+                return result
+        lo, hi = self._range(prefix)
+        best = heapq.nlargest(
+            k, (i for i in range(lo, hi) if self.words[i] not in used), key=self.freq.__getitem__
+        )
+        return [self.words[i] for i in best]
+
+    def __contains__(self, word):
+        index = bisect_left(self.words, word)
+        return index < len(self.words) and self.words[index] == word
+
+
+def read_word_list(path):
+    """단어 목록 파일을 (단어, 빈도) 목록으로 읽습니다. 빈도가 없으면 1 로 봅니다."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.strip().split("\t")
+            if not parts[0]:
+                continue
+            freq = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
+            entries.append((parts[0], freq))
+    return entries
+
+
+def load_word_index(path=DEFAULT_PATH):
+    """단어 목록 파일로 색인을 만듭니다. 파일이 없으면 None.
+
+    만든 색인은 공유 디스크 캐시에 저장해 두므로 다른 서버 프로세스는 색인을
+    다시 만들지 않고 바로 불러옵니다.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    cache = get_disk_cache()
+    key = ("word_index", os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    data = cache.get(key)
+    if data is not None:
+        return pickle.loads(data)
+
+    index = WordIndex(read_word_list(path))
+    cache.set(key, pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+    return index
+
+
+_index = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_word_index():
+    """모든 세션이 함께 쓰는 단어 색인을 돌려줍니다. 단어 목록이 없으면 None."""
+    global _index, _index_loaded
+    with _index_lock:
+        if not _index_loaded:
+            _index = load_word_index()
+            _index_loaded = True
+        return _index
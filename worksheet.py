@@ -0,0 +1,120 @@
+"""유리함수 학습지(PDF)를 시드로부터 일괄 생성합니다.
+
+그래프는 그림(PNG)으로 만들어 붙이지 않고 페이지의 축에 바로 벡터로 그립니다.
+학생 페이지의 축, 눈금, 격자는 한 번만 만들어 두고 학생마다 곡선과 점근선의
+데이터만 바꿔 저장하므로, 페이지마다 그림을 새로 만드는 비용이 들지 않습니다.
+페이지는 완성되는 대로 PDF 에 바로 기록하므로 학생 수가 늘어나도 메모리
+사용량은 거의 일정합니다.
+"""
+import random
+
+from matplotlib import rc_context
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from rational_utils import exact_properties, korean_font_rc, linear_latex, random_coefficients, sample_curve
+
+A4_SIZE = (8.27, 11.69)
+ANSWERS_PER_PAGE = 24
+# 페이지 모양이 바뀌면 올려서, 캐시에 남은 예전 PDF 를 쓰지 않게 합니다.
+LAYOUT_VERSION = 2
+
+
+def generate_problems(seed, students, per_student=4):
+    """학생마다 per_student 개의 유리함수 계수를 만듭니다."""
+    rng = random.Random(seed)
+    return [
+        [random_coefficients(rng) for _ in range(per_student)]
+        for _ in range(students)
+    ]
+
+
+class _StudentPage:
+    """학생 페이지 틀. 그림과 축은 한 번만 만들고 update 로 문제만 바꿉니다."""
+
+    def __init__(self, per_student):
+        self.fig = Figure(figsize=A4_SIZE)
+        self.heading = self.fig.suptitle("", fontsize=16)
+        self.fig.text(0.5, 0.93, "각 함수의 점근선과 대칭의 중심을 구하시오.", ha="center", fontsize=11)
+        rows = (per_student + 1) // 2
+        axes = self.fig.subplots(max(rows, 1), 2, squeeze=False)
+        self.fig.subplots_adjust(top=0.88, bottom=0.05, hspace=0.35, wspace=0.25)
+
+        self.slots = []
+        for index, ax in enumerate(axes.flat):
+            if index >= per_student:
+                ax.axis("off")
+                continue
+            ax.set_xlim(-10, 10)
+            ax.set_ylim(-10, 10)
+            ax.set_xticks(range(-10, 11, 5))
+            ax.set_yticks(range(-10, 11, 5))
+            ax.grid(True, linestyle=':', alpha=0.6)
+            ax.axhline(0, color='black', linewidth=0.8)
+            ax.axvline(0, color='black', linewidth=0.8)
+            left, = ax.plot([], [], color='blue')
+            right, = ax.plot([], [], color='blue')
+            vertical = ax.axvline(0, color='red', linestyle='--', linewidth=1)
+            horizontal = ax.axhline(0, color='green', linestyle='--', linewidth=1)
+            # 제목 위치를 정해 두면 페이지마다 눈금 글자의 크기를 다시 재지 않습니다.
+            title = ax.set_title("", fontsize=10, y=1.02)
+            self.slots.append((left, right, vertical, horizontal, title))
+
+    def update(self, student, coefficients_list):
+        self.heading.set_text(f"유리함수 학습지 - 학생 {student}")
+        for index, (coefficients, slot) in enumerate(zip(coefficients_list, self.slots), start=1):
+            left, right, vertical, horizontal, title = slot
+            a, b, c, d = coefficients
+            pieces = sample_curve(a, b, c, d, num=200)
+            left.set_data(*pieces[0])
+            right.set_data(*(pieces[1] if len(pieces) > 1 else ([], [])))
+            vertical.set_xdata([-d / c, -d / c])
+            horizontal.set_ydata([a / c, a / c])
+            title.set_text(f"{index}번) {_function_text(a, b, c, d)}")
+        return self.fig
+
+
+def _function_text(a, b, c, d):
+    # 수식 조판(mathtext)은 식마다 수십 ms 가 걸리므로 학습지에서는 일반 글자로 적습니다.
+    return f"y = ({linear_latex(a, b)})/({linear_latex(c, d)})"
+
+
+def _answer_lines(problems):
+    for student, coefficients_list in enumerate(problems, start=1):
+        for index, (a, b, c, d) in enumerate(coefficients_list, start=1):
+            props = exact_properties(a, b, c, d)
+            vertical, horizontal = props["vertical"], props["horizontal"]
+            yield (
+                f"학생 {student} - {index}번: {_function_text(a, b, c, d)}   "
+                f"점근선 x = {vertical}, y = {horizontal},  중심 ({vertical}, {horizontal})"
+            )
+
+
+def _answer_page(lines):
+    fig = Figure(figsize=A4_SIZE)
+    fig.text(0.5, 0.96, "정답지", ha="center", fontsize=16)
+    for row, line in enumerate(lines):
+        fig.text(0.06, 0.92 - row * 0.037, line, fontsize=9)
+    return fig
+
+
+def build_worksheet_pdf(output, seed, students=40, per_student=4):
+    """학습지와 정답지를 output(파일 경로 또는 파일 객체)에 PDF 로 기록합니다.
+
+    한글 글꼴은 이 함수 안에서만 적용되므로 다른 페이지의 그래프에는 영향이 없습니다.
+    """
+    problems = generate_problems(seed, students, per_student)
+
+    with rc_context(korean_font_rc()), PdfPages(output) as pdf:
+        page = _StudentPage(per_student)
+        for student, coefficients_list in enumerate(problems, start=1):
+            pdf.savefig(page.update(student, coefficients_list))
+
+        lines = []
+        for line in _answer_lines(problems):
+            lines.append(line)
+            if len(lines) == ANSWERS_PER_PAGE:
+                pdf.savefig(_answer_page(lines))
+                lines = []
+        if lines:
+            pdf.savefig(_answer_page(lines))